@@ -18,19 +18,29 @@ Example usage:
     password = gen.generate("{word(animal)} {word(color)}")
 """
 
+from importlib import import_module
+
 __version__ = "0.1.3"
 __author__ = "Terrence Jones"
 __license__ = "Apache-2.0"
 
-from pyfwert.generator import PasswordGenerator, generate_password
-from pyfwert.wordlists import (
-    set_wordlist_dir,
-    get_default_wordlist_dir,
-    random_word,
-    load_patterns,
-    get_random_pattern,
-)
-from pyfwert.pronounceable import pronounceable_word, fakeword
+# Submodule attributes are loaded lazily (PEP 562) so lightweight uses
+# like "pyfwert --version" don't pay for importing the full generator.
+_LAZY = {
+    # Main API
+    "PasswordGenerator": ("pyfwert.generator", "PasswordGenerator"),
+    "generate_password": ("pyfwert.generator", "generate_password"),
+    # Wordlist functions
+    "set_wordlist_dir": ("pyfwert.wordlists", "set_wordlist_dir"),
+    "get_default_wordlist_dir": ("pyfwert.wordlists", "get_default_wordlist_dir"),
+    "random_word": ("pyfwert.wordlists", "random_word"),
+    "random_words": ("pyfwert.wordlists", "random_words"),
+    "load_patterns": ("pyfwert.wordlists", "load_patterns"),
+    "get_random_pattern": ("pyfwert.wordlists", "get_random_pattern"),
+    # Word generation
+    "pronounceable_word": ("pyfwert.pronounceable", "pronounceable_word"),
+    "fakeword": ("pyfwert.pronounceable", "fakeword"),
+}
 
 __all__ = [
     # Main API
@@ -40,6 +50,7 @@ __all__ = [
     "set_wordlist_dir",
     "get_default_wordlist_dir",
     "random_word",
+    "random_words",
     "load_patterns",
     "get_random_pattern",
     # Word generation
@@ -48,3 +59,19 @@ __all__ = [
     # Version info
     "__version__",
 ]
+
+
+def __getattr__(name):
+    """Resolve lazily-exported attributes on first access."""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -69,20 +69,26 @@ Modifiers:
 
     gen = PasswordGenerator()
 
-    if not args.quiet:
-        print()
-        print("=" * 60)
-        print("  Pyfwert - Pattern-based Password Generator")
-        print("=" * 60)
-        print()
+    if args.quiet:
+        # Batch generation and a single write instead of per-password print
+        try:
+            passwords = gen.generate_many(args.count, args.pattern)
+            sys.stdout.write("\n".join(passwords) + "\n")
+        except Exception as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+        return
+
+    print()
+    print("=" * 60)
+    print("  Pyfwert - Pattern-based Password Generator")
+    print("=" * 60)
+    print()
 
     for i in range(args.count):
         try:
             password = gen.generate(args.pattern)
 
-            if args.quiet:
-                print(password)
-            elif args.show_pattern:
+            if args.show_pattern:
                 # Truncate long patterns
                 pattern = gen.last_pattern
                 if len(pattern) > 40:
@@ -91,20 +97,16 @@ Modifiers:
             else:
                 print(f"  {i+1:2}. {password}")
         except Exception as e:
-            if args.quiet:
-                print(f"ERROR: {e}", file=sys.stderr)
-            else:
-                print(f"  {i+1:2}. (error: {e})")
+            print(f"  {i+1:2}. (error: {e})")
 
-    if not args.quiet:
-        print()
-        print("-" * 60)
-        if args.pattern:
-            print(f"  Pattern: {args.pattern}")
-        else:
-            print("  Tip: Use -p to specify a custom pattern")
-            print("       Use --show-pattern to see patterns used")
-        print()
+    print()
+    print("-" * 60)
+    if args.pattern:
+        print(f"  Pattern: {args.pattern}")
+    else:
+        print("  Tip: Use -p to specify a custom pattern")
+        print("       Use --show-pattern to see patterns used")
+    print()
 
 
 if __name__ == "__main__":
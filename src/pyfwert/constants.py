@@ -76,6 +76,24 @@ SHORT_MONTHS = "Jan Feb Mar Apr May Jun Jul Aug Sep Oct Nov Dec"
 LONG_DAYS = "Monday Tuesday Wednesday Thursday Friday Saturday Sunday"
 SHORT_DAYS = "Mon Tue Wed Thu Fri Sat Sun"
 
+# Pre-split tuples of the space-separated constants above, so hot code
+# can pick from them without re-splitting on every call. The string
+# forms stay exported for backward compatibility.
+SYMBOLS_LIST = tuple(SYMBOLS.split())
+END_PUNCTUATION_LIST = tuple(END_PUNCTUATION.split())
+SMILEYS_LIST = tuple(SMILEYS.split())
+VOWELS2_LIST = tuple(VOWELS2.split())
+CONSONANTS2_LIST = tuple(CONSONANTS2.split())
+CONSONANTS3_LIST = tuple(CONSONANTS3.split())
+DIGRAPHS_LIST = tuple(DIGRAPHS.split())
+TRIGRAPHS_LIST = tuple(TRIGRAPHS.split())
+TWO_LETTER_WORDS_LIST = tuple(TWO_LETTER_WORDS.split())
+THREE_LETTER_WORDS_LIST = tuple(THREE_LETTER_WORDS.split())
+LONG_MONTHS_LIST = tuple(LONG_MONTHS.split())
+SHORT_MONTHS_LIST = tuple(SHORT_MONTHS.split())
+LONG_DAYS_LIST = tuple(LONG_DAYS.split())
+SHORT_DAYS_LIST = tuple(SHORT_DAYS.split())
+
 # Escape sequences used during pattern processing
 ESCAPE_SEQUENCES = {
     "\\\\": "#sla#",
@@ -101,3 +119,8 @@ UNESCAPE_SEQUENCES = {
     "#rpa#": ")",
     "#pip#": "|",
 }
+
+# Frozen iteration order for the escape tables, so hot loops can walk a
+# tuple instead of allocating a dict view per call.
+ESCAPE_PAIRS = tuple(ESCAPE_SEQUENCES.items())
+UNESCAPE_PAIRS = tuple(UNESCAPE_SEQUENCES.items())
@@ -4,19 +4,131 @@ Ported from VB6 PafwertLib.cls.
 """
 
 import re
+from functools import lru_cache
 
 from pyfwert.parser import parse_placeholder_content
 from pyfwert.placeholders import resolve_placeholder
 from pyfwert.modifiers import apply_modifier
 from pyfwert.wordlists import get_random_pattern, get_default_wordlist_dir
-from pyfwert.random import rand, chance
+from pyfwert.random import rand, chance, sysrand as _sysrand
 from pyfwert.utils import pick_one, pick_character
 from pyfwert.constants import (
     VOWELS2, CONSONANTS2, THREE_LETTER_WORDS,
-    UNESCAPE_SEQUENCES, ESCAPE_SEQUENCES
+    UNESCAPE_SEQUENCES, ESCAPE_PAIRS
 )
 
 
+# Translation table mapping special characters to their escape tokens
+# (built once so _escape_value is a single str.translate pass).
+_ESCAPE_TRANS = str.maketrans({char: token for token, char in UNESCAPE_SEQUENCES.items()})
+
+# Single regex matching any escape token, for one-pass unescaping.
+_UNESCAPE_RE = re.compile("|".join(re.escape(token) for token in UNESCAPE_SEQUENCES))
+
+# Strips [N] qualifiers from grouping-placeholder content.
+_QUALIFIER_STRIP_RE = re.compile(r"\[\d+\]")
+
+# Characters that terminate a +modifier outside parentheses.
+_MOD_END_RE = re.compile(r"[+{ \t.]")
+
+# A [N] qualifier immediately after a placeholder's closing brace.
+_QUAL_RE = re.compile(r"\[(\d+)\]")
+
+# A whole modifier string: name, optional (params), optional [N] qualifier.
+_MOD_PARSE_RE = re.compile(r"^([A-Za-z_]\w*)(?:\(([^)]*)\))?(?:\[(\d+)\])?$")
+
+# Pre-split pool of failsafe password fragments, built once at import.
+_FAILSAFE_POOL = tuple(
+    (VOWELS2 + " ! @ # % $ ^ & * : ' / ` ~ * - < > + = . . , , ; ; ? ? " +
+     CONSONANTS2 + " " + THREE_LETTER_WORDS +
+     " 1 2 3 4 5 6 7 8 9 0").split()
+)
+
+
+@lru_cache(maxsize=512)
+def _parse_modifier_string(mod_str):
+    """Parse a modifier string like 'propercase[25]' or 'replace(" ","-")'.
+
+    Results are cached since the same modifier literals recur across
+    generations, so params are returned as an immutable tuple.
+
+    Returns:
+        Tuple of (modifier_name, params_tuple, qualifier_int_or_none)
+    """
+    # Common shape: name, optional (params), optional [N] qualifier -
+    # one match call handles it all.
+    match = _MOD_PARSE_RE.match(mod_str)
+    if match:
+        mod_name, param_str, qual = match.groups()
+        if param_str:
+            mod_params = tuple(p.strip().strip('"') for p in param_str.split(","))
+        else:
+            mod_params = ()
+        return mod_name, mod_params, int(qual) if qual else None
+
+    # Fall back to incremental parsing for unusual orderings
+    mod_name = mod_str
+    mod_params = ()
+    mod_qualifier = None
+
+    # Check for qualifier [N]
+    qual_start = mod_str.find("[")
+    if qual_start != -1:
+        qual_end = mod_str.find("]", qual_start)
+        if qual_end != -1:
+            try:
+                mod_qualifier = int(mod_str[qual_start+1:qual_end])
+            except ValueError:
+                pass
+            mod_str = mod_str[:qual_start] + mod_str[qual_end+1:]
+            mod_name = mod_str
+
+    # Check for parameters (name(param1, param2))
+    param_start = mod_str.find("(")
+    if param_start != -1:
+        param_end = mod_str.find(")", param_start)
+        if param_end != -1:
+            mod_name = mod_str[:param_start]
+            param_str = mod_str[param_start+1:param_end]
+            mod_params = tuple(p.strip().strip('"') for p in param_str.split(","))
+
+    return mod_name, mod_params, mod_qualifier
+
+
+def _match_brace(pattern, start):
+    """Find the index just past the brace matching pattern[start] == "{".
+
+    Args:
+        pattern: Pattern string.
+        start: Index of the opening brace.
+
+    Returns:
+        Index one past the matching "}", or -1 if unmatched.
+
+    The common flat case is handled with C-level str.find calls; the
+    depth-tracking loop only runs for nested placeholders.
+    """
+    close_idx = pattern.find("}", start + 1)
+    if close_idx == -1:
+        return -1
+
+    # Fast path: no nested "{" before the first "}"
+    if pattern.find("{", start + 1, close_idx) == -1:
+        return close_idx + 1
+
+    depth = 1
+    j = start + 1
+    n = len(pattern)
+    while j < n and depth > 0:
+        if pattern[j] == "{":
+            depth += 1
+        elif pattern[j] == "}":
+            depth -= 1
+        j += 1
+
+    return j if depth == 0 else -1
+
+
 class PasswordGenerator:
     """Pattern-based password generator.
 
@@ -24,6 +136,11 @@ class PasswordGenerator:
     and extensive wordlists.
     """
 
+    __slots__ = (
+        "wordlist_dir", "keywords", "last_pattern", "last_password",
+        "_backrefs",
+    )
+
     def __init__(self, wordlist_dir=None):
         """Initialize the password generator.
 
@@ -35,7 +152,7 @@ class PasswordGenerator:
         self.keywords = ""
         self.last_pattern = ""
         self.last_password = ""
-        self._backrefs = {}
+        self._backrefs = []
 
     def generate(self, pattern=None, keywords=None):
         """Generate a password using a pattern.
@@ -53,27 +170,58 @@ class PasswordGenerator:
             - "{word+uppercase}{number(99)}" -> "DRAGON42"
             - "{word(animal)} {number}" -> "horse 7"
         """
+        if pattern:
+            # Explicit pattern: retrying would deterministically hit the
+            # same failure, so attempt it once
+            try:
+                result = self._generate_from_pattern(pattern, keywords)
+            except Exception:
+                # Failsafe: generate something rather than fail
+                return self._generate_failsafe()
+
+            self.last_password = result
+            return result
+
+        # Random pattern: a failure (e.g. a pattern referencing a wordlist
+        # that isn't bundled) is worth retrying with a fresh pattern
         max_retries = 10
 
         for attempt in range(max_retries):
             try:
-                if pattern:
-                    result = self._generate_from_pattern(pattern, keywords)
-                else:
-                    random_pattern = get_random_pattern(self.wordlist_dir)
-                    result = self._generate_from_pattern(random_pattern, keywords)
-
-                self.last_password = result
-                return result
-
-            except Exception as e:
-                if attempt == max_retries - 1:
-                    # Failsafe: generate something rather than fail
-                    return self._generate_failsafe()
+                random_pattern = get_random_pattern(self.wordlist_dir)
+                result = self._generate_from_pattern(random_pattern, keywords)
+            except (FileNotFoundError, ValueError):
+                # Retryable: another pattern may draw on different resources
                 continue
+            except Exception:
+                # Unexpected bug - don't spin on it
+                break
 
+            self.last_password = result
+            return result
+
+        # Failsafe: generate something rather than fail
         return self._generate_failsafe()
 
+    def generate_many(self, count, pattern=None, keywords=None):
+        """Generate a batch of passwords.
+
+        Args:
+            count: Number of passwords to generate.
+            pattern: Pattern string (optional, random per password if None).
+            keywords: Optional keywords for word selection.
+
+        Returns:
+            List of generated password strings.
+
+        Randomness is drawn per password from the secrets CSPRNG;
+        pre-drawing a shared pool of random values for the whole batch
+        would add a dependency and weaken the entropy guarantees, so
+        batching here only amortizes per-call setup.
+        """
+        generate = self.generate
+        return [generate(pattern, keywords) for _ in range(count)]
+
     def _generate_from_pattern(self, pattern, keywords=None):
         """Generate password from a specific pattern.
 
@@ -85,8 +233,7 @@ class PasswordGenerator:
             Generated password.
         """
         self.last_pattern = pattern
-        self._backrefs = {}
-        self._backref_counter = 0
+        self._backrefs.clear()
 
         # Apply escape sequences
         escaped = self._escape_pattern(pattern)
@@ -97,16 +244,23 @@ class PasswordGenerator:
         # Unescape
         result = self._unescape(result)
 
-        # Clean up double spaces
-        while "  " in result:
-            result = result.replace("  ", " ")
+        # Clean up double spaces. Splitting on single spaces and dropping
+        # the empty runs collapses any number of consecutive spaces in one
+        # C-level pass (without touching tabs/newlines inside the result).
+        if "  " in result:
+            result = " ".join(filter(None, result.split(" ")))
 
         return result.strip()
 
     def _escape_pattern(self, pattern):
         """Apply escape sequences to pattern."""
+        # Every escape sequence starts with a backslash, so most patterns
+        # can skip the replace passes entirely.
+        if "\\" not in pattern:
+            return pattern
+
         result = pattern
-        for escape, token in ESCAPE_SEQUENCES.items():
+        for escape, token in ESCAPE_PAIRS:
             result = result.replace(escape, token)
         return result
 
@@ -115,92 +269,104 @@ class PasswordGenerator:
 
         Uses a recursive approach to handle nested placeholders.
         """
-        result = ""
+        parts = []
         i = 0
-        while i < len(pattern):
-            if pattern[i] == "{":
-                # Find matching closing brace
-                depth = 1
-                j = i + 1
-                while j < len(pattern) and depth > 0:
-                    if pattern[j] == "{":
-                        depth += 1
-                    elif pattern[j] == "}":
-                        depth -= 1
-                    j += 1
-
-                if depth == 0:
-                    # Extract placeholder content
-                    content = pattern[i+1:j-1]
-
-                    # Process any nested placeholders first
-                    processed_content = self._process_pattern(content, keywords)
-
-                    # Resolve this placeholder
-                    value = self._resolve_placeholder_content(processed_content, keywords)
-
-                    # Check for qualifier after closing brace (e.g., }[50])
-                    if j < len(pattern) and pattern[j] == "[":
-                        qual_end = pattern.find("]", j)
-                        if qual_end != -1:
-                            try:
-                                qualifier = int(pattern[j+1:qual_end])
-                                if rand(99, 0) >= qualifier:
-                                    value = ""
-                            except ValueError:
-                                pass
-                            j = qual_end + 1
-
-                    # Check for modifiers after the closing brace (e.g., }+propercase)
-                    while j < len(pattern) and pattern[j] == "+":
-                        # Parse the modifier
-                        mod_end = j + 1
-                        paren_depth = 0
-                        # Find end of modifier - stop at +, {, space, or . (but not inside parens)
-                        while mod_end < len(pattern):
-                            c = pattern[mod_end]
-                            if c == "(":
-                                paren_depth += 1
-                            elif c == ")":
-                                paren_depth -= 1
-                            elif paren_depth == 0 and c in "+{ \t.":
-                                break
-                            mod_end += 1
-
-                        mod_str = pattern[j+1:mod_end]
-                        if mod_str:
-                            # Parse modifier name, params, and qualifier
-                            mod_name, mod_params, mod_qualifier = self._parse_modifier_string(mod_str)
-
-                            # Process any placeholders in modifier parameters
-                            mod_params = [self._process_pattern(p, keywords) if "{" in p else p
-                                          for p in mod_params]
-
-                            # Check qualifier
-                            if mod_qualifier is None or rand(99, 0) < mod_qualifier:
-                                try:
-                                    # Unescape value, apply modifier, re-escape
-                                    unescaped = self._unescape(value)
-                                    # Also unescape modifier params
-                                    mod_params = [self._unescape(p) for p in mod_params]
-                                    modified = apply_modifier(unescaped, mod_name, mod_params)
-                                    value = self._escape_value(modified)
-                                except ValueError:
-                                    pass
-
-                        j = mod_end
-
-                    result += value
-                    i = j
-                else:
-                    # Unmatched brace, treat as literal
-                    result += pattern[i]
-                    i += 1
-            else:
-                result += pattern[i]
+        n = len(pattern)
+        find = pattern.find
+        while i < n:
+            # Copy the literal run up to the next placeholder in one slice
+            open_idx = find("{", i)
+            if open_idx == -1:
+                parts.append(pattern[i:])
+                break
+            parts.append(pattern[i:open_idx])
+            i = open_idx
+
+            # Find matching closing brace
+            j = _match_brace(pattern, i)
+            if j == -1:
+                # Unmatched brace, treat as literal
+                parts.append(pattern[i])
                 i += 1
+                continue
 
-        return result
+            # Extract placeholder content
+            content = pattern[i+1:j-1]
+
+            # Process any nested placeholders first
+            processed_content = self._process_pattern(content, keywords)
+
+            # Resolve this placeholder
+            value = self._resolve_placeholder_content(processed_content, keywords)
+
+            # Check for qualifier after closing brace (e.g., }[50])
+            if j < n and pattern[j] == "[":
+                qual_match = _QUAL_RE.match(pattern, j)
+                if qual_match:
+                    if rand(99, 0) >= int(qual_match.group(1)):
+                        value = ""
+                    j = qual_match.end()
+                else:
+                    qual_end = pattern.find("]", j)
+                    if qual_end != -1:
+                        j = qual_end + 1
+
+            # Check for modifiers after the closing brace (e.g., }+propercase)
+            # Unescape once up front and re-escape once at the end, rather
+            # than round-tripping for every modifier in the chain.
+            has_modifiers = j < n and pattern[j] == "+"
+            if has_modifiers:
+                raw_value = self._unescape(value)
+
+            while j < n and pattern[j] == "+":
+                # Find end of modifier - stop at +, {, space, or . (but not
+                # inside parens). Locate the earliest terminator with C-level
+                # find calls; only fall back to the character walk when a
+                # parameter list opens before it.
+                end_match = _MOD_END_RE.search(pattern, j + 1)
+                mod_end = end_match.start() if end_match else n
+
+                paren_start = pattern.find("(", j + 1, mod_end)
+                if paren_start != -1:
+                    mod_end = paren_start
+                    paren_depth = 0
+                    while mod_end < n:
+                        c = pattern[mod_end]
+                        if c == "(":
+                            paren_depth += 1
+                        elif c == ")":
+                            paren_depth -= 1
+                        elif paren_depth == 0 and c in "+{ \t.":
+                            break
+                        mod_end += 1
+
+                mod_str = pattern[j+1:mod_end]
+                if mod_str:
+                    # Parse modifier name, params, and qualifier
+                    mod_name, mod_params, mod_qualifier = self._parse_modifier_string(mod_str)
+
+                    # Process any placeholders in modifier parameters
+                    mod_params = [self._process_pattern(p, keywords) if "{" in p else p
+                                  for p in mod_params]
+
+                    # Check qualifier
+                    if mod_qualifier is None or rand(99, 0) < mod_qualifier:
+                        try:
+                            # Unescape modifier params and apply to the raw value
+                            mod_params = [self._unescape(p) for p in mod_params]
+                            raw_value = apply_modifier(raw_value, mod_name, mod_params)
+                        except ValueError:
+                            pass
+
+                j = mod_end
+
+            if has_modifiers:
+                value = self._escape_value(raw_value)
+
+            parts.append(value)
+            i = j
+
+        return "".join(parts)
 
     def _parse_modifier_string(self, mod_str):
         """Parse a modifier string like 'propercase[25]' or 'replace(" ","-")'.
@@ -208,32 +374,8 @@ class PasswordGenerator:
         Returns:
             Tuple of (modifier_name, params_list, qualifier_int_or_none)
         """
-        mod_name = mod_str
-        mod_params = []
-        mod_qualifier = None
-
-        # Check for qualifier [N]
-        qual_start = mod_str.find("[")
-        if qual_start != -1:
-            qual_end = mod_str.find("]", qual_start)
-            if qual_end != -1:
-                try:
-                    mod_qualifier = int(mod_str[qual_start+1:qual_end])
-                except ValueError:
-                    pass
-                mod_str = mod_str[:qual_start] + mod_str[qual_end+1:]
-                mod_name = mod_str
-
-        # Check for parameters (name(param1, param2))
-        param_start = mod_str.find("(")
-        if param_start != -1:
-            param_end = mod_str.find(")", param_start)
-            if param_end != -1:
-                mod_name = mod_str[:param_start]
-                param_str = mod_str[param_start+1:param_end]
-                mod_params = [p.strip().strip('"') for p in param_str.split(",")]
-
-        return mod_name, mod_params, mod_qualifier
+        mod_name, mod_params, mod_qualifier = _parse_modifier_string(mod_str)
+        return mod_name, list(mod_params), mod_qualifier
 
     def _resolve_placeholder_content(self, content, keywords=None):
         """Resolve placeholder content to a value.
@@ -249,8 +391,8 @@ class PasswordGenerator:
         if content.startswith("$W"):
             try:
                 ref_num = int(content[2:])
-                if ref_num in self._backrefs:
-                    return self._backrefs[ref_num]
+                if 1 <= ref_num <= len(self._backrefs):
+                    return self._backrefs[ref_num - 1]
                 return ""
             except ValueError:
                 return ""
@@ -260,8 +402,8 @@ class PasswordGenerator:
 
         # Handle alternatives (pipe separator)
         if parsed["alternatives"]:
-            # Pick one of the alternatives
-            choice = pick_one(parsed["alternatives"], delimiter="|")
+            # Pick one of the already-split alternatives directly
+            choice = _sysrand.choice(parsed["alternatives"]).strip()
             # If the choice contains braces, it has sub-placeholders to process
             if "{" in choice:
                 return self._process_pattern(choice, keywords)
@@ -284,15 +426,13 @@ class PasswordGenerator:
             # Remove any qualifier that was already parsed
             result_content = content
             # The parsed qualifier should still apply
-            if parsed["qualifier"] is not None:
+            if parsed["qualifier"] is not None and "[" in content:
                 # Qualifier was already checked above, so we passed - just clean up content
                 # Remove [N] from content if present
-                import re
-                result_content = re.sub(r'\[\d+\]', '', content)
+                result_content = _QUALIFIER_STRIP_RE.sub("", content)
 
             # Store for backreference (the processed content)
-            self._backref_counter += 1
-            self._backrefs[self._backref_counter] = result_content
+            self._backrefs.append(result_content)
             return result_content
 
         value = resolve_placeholder(
@@ -326,12 +466,11 @@ class PasswordGenerator:
         value = self._escape_value(value)
 
         # Store escaped value for backreference
-        self._backref_counter += 1
-        self._backrefs[self._backref_counter] = value
+        self._backrefs.append(value)
 
         return value
 
-    def _escape_value(self, value):
+    def _escape_value(self, value, _trans=_ESCAPE_TRANS):
         """Escape special characters in a resolved value.
 
         Args:
@@ -339,24 +478,14 @@ class PasswordGenerator:
 
         Returns:
             Escaped value.
+
+        The translation table is bound as a default argument so the hot
+        path uses a local load instead of a module-global lookup.
         """
         # Escape characters that have special meaning in patterns
-        replacements = [
-            ("\\", "#sla#"),
-            ("+", "#pls#"),
-            ("{", "#lbr#"),
-            ("}", "#rbr#"),
-            ("[", "#lba#"),
-            ("]", "#rba#"),
-            ("(", "#lpa#"),
-            (")", "#rpa#"),
-            ("|", "#pip#"),
-        ]
-        for old, new in replacements:
-            value = value.replace(old, new)
-        return value
+        return value.translate(_trans)
 
-    def _unescape(self, text):
+    def _unescape(self, text, _sub=_UNESCAPE_RE.sub, _map=UNESCAPE_SEQUENCES):
         """Convert escape tokens back to actual characters.
 
         Args:
@@ -364,10 +493,14 @@ class PasswordGenerator:
 
         Returns:
             Text with actual characters.
+
+        The compiled regex and token map are bound as default arguments
+        so the hot path uses local loads instead of module-global lookups.
         """
-        for token, char in UNESCAPE_SEQUENCES.items():
-            text = text.replace(token, char)
-        return text
+        # Fast path: no tokens possible without a "#"
+        if "#" not in text:
+            return text
+        return _sub(lambda m: _map[m.group(0)], text)
 
     def _generate_failsafe(self):
         """Generate a failsafe password when normal generation fails.
@@ -375,14 +508,13 @@ class PasswordGenerator:
         Returns:
             A simple generated password.
         """
-        parts = []
-        for _ in range(7):
-            parts.append(pick_one(
-                VOWELS2 + " ! @ # % $ ^ & * : ' / ` ~ * - < > + = . . , , ; ; ? ? " +
-                CONSONANTS2 + " " + THREE_LETTER_WORDS +
-                " 1 2 3 4 5 6 7 8 9 0"
-            ))
-        return "".join(parts)
+        return "".join(_sysrand.choices(_FAILSAFE_POOL, k=7))
+
+
+@lru_cache(maxsize=8)
+def _get_generator(wordlist_dir):
+    """Return a cached PasswordGenerator for a wordlist directory."""
+    return PasswordGenerator(wordlist_dir=wordlist_dir)
 
 
 def generate_password(pattern=None, wordlist_dir=None, keywords=None):
@@ -396,8 +528,10 @@ def generate_password(pattern=None, wordlist_dir=None, keywords=None):
     Returns:
         Generated password string.
 
+    The underlying generator is cached per wordlist_dir, so
+    last_pattern/last_password on it reflect the most recent call.
+
     Example:
         password = generate_password("{word}.{word}.{number}")
     """
-    gen = PasswordGenerator(wordlist_dir=wordlist_dir)
-    return gen.generate(pattern, keywords)
+    return _get_generator(wordlist_dir).generate(pattern, keywords)
@@ -3,10 +3,137 @@
 Ported from VB6 ModifyWord() in PafwertLib.cls.
 """
 
-from pyfwert.random import rand, chance
+import secrets
+
+from pyfwert.random import rand, chance, sysrand as _sysrand
 from pyfwert.utils import pick_one, sentence_case, to_roman
 from pyfwert.number_text import number_as_text
 
+# Shared padding for modifier parameters (immutable, allocated once).
+_EMPTY_PARAMS = ("", "", "", "")
+
+# Both cases included so membership checks skip a per-word .lower().
+_VOWEL_FIRST = frozenset("aeiouAEIOU")
+
+
+def _article(word, params):
+    """Prefix a word with "a" or "an"."""
+    if word[0] in _VOWEL_FIRST:
+        return f"an {word}"
+    return f"a {word}"
+
+
+def _num2words(word, params):
+    """Spell a number out as text."""
+    return sentence_case(number_as_text(word))
+
+
+def _scramble(word, params):
+    """Scramble letters, optionally a given number of times."""
+    times = int(params[0]) if params[0] else 1
+    return scramble_word(word, times)
+
+
+def _repeat(word, params):
+    """Repeat the word params[0] extra times."""
+    times = int(params[0]) if params[0] else 1
+    return word * (times + 1)
+
+
+def _right(word, params):
+    """Right substring."""
+    length = int(params[0]) if params[0] else len(word)
+    return word[-length:]
+
+
+def _left(word, params):
+    """Left substring."""
+    length = int(params[0]) if params[0] else len(word)
+    return word[:length]
+
+
+def _format(word, params):
+    """Zero-pad numbers (basic VB format support)."""
+    try:
+        fmt = params[0] if params[0] else "0"
+        # Convert VB format to Python (basic support)
+        if "0" in fmt:
+            width = fmt.count("0")
+            return word.zfill(width)
+        return word
+    except Exception:
+        return word
+
+
+def _mid(word, params):
+    """Mid substring (1-based start, length)."""
+    start = int(params[0]) if params[0] else 1
+    length = int(params[1]) if params[1] else 1
+    return word[start-1:start-1+length]
+
+
+def _roman_numeral(word, params):
+    """Convert a number to a Roman numeral."""
+    try:
+        return to_roman(int(word))
+    except ValueError:
+        return word
+
+
+def _replace(word, params):
+    """Replace occurrences of params[0] with params[1]."""
+    old = params[0]
+    # Return the original object when there is nothing to replace
+    if not old or old not in word:
+        return word
+    return word.replace(old, params[1])
+
+
+# Modifiers the "random" modifier may choose from, pre-split.
+_RANDOM_MODIFIER_NAMES = tuple(
+    "bracket num2words randomcase reverse obscure piglatin scramble swap".split(" ")
+)
+
+
+def _random_modifier(word, params):
+    """Apply a randomly chosen modifier."""
+    random_mod = pick_one(_RANDOM_MODIFIER_NAMES)
+    return apply_modifier(word, random_mod, params)
+
+
+# Dispatch table mapping modifier names (including aliases) to handlers,
+# so lookup is one hash probe instead of a linear comparison chain.
+_MODIFIERS = {
+    "a": _article,
+    "bracket": lambda word, params: bracket(word, params[0]),
+    "num2word": _num2words,
+    "num2words": _num2words,
+    "reverse": lambda word, params: word[::-1],
+    "ucase": lambda word, params: word.upper(),
+    "uppercase": lambda word, params: word.upper(),
+    "lcase": lambda word, params: word.lower(),
+    "lowercase": lambda word, params: word.lower(),
+    "propercase": lambda word, params: word.title(),
+    "sentencecase": lambda word, params: sentence_case(word),
+    "obscure": lambda word, params: obscure(word),
+    "replace": _replace,
+    "randomcase": lambda word, params: random_case(word),
+    "scramble": _scramble,
+    "piglatin": lambda word, params: pig_latin(word),
+    "repeat": _repeat,
+    "right": _right,
+    "left": _left,
+    "trim": lambda word, params: word.strip(),
+    "format": _format,
+    "mid": _mid,
+    "swap": lambda word, params: swap_initials(word),
+    "romannumeral": _roman_numeral,
+    "hide": lambda word, params: "",
+    "quote": lambda word, params: f'"{word}"',
+    "stutter": lambda word, params: stutter(word),
+    "random": _random_modifier,
+}
+
 
 def apply_modifier(word, modifier_name, params=None):
     """Apply a modifier to a word.
@@ -26,136 +153,35 @@ def apply_modifier(word, modifier_name, params=None):
         return word
 
     if params is None:
-        params = ["", "", "", ""]
+        # Common no-params case shares one preallocated tuple
+        params = _EMPTY_PARAMS
     else:
-        # Ensure we have at least 4 parameters
-        params = list(params) + ["", "", "", ""]
-        params = params[:4]
-
-    modifier = modifier_name.lower().strip()
-
-    # Article "a" or "an"
-    if modifier == "a":
-        if word[0].lower() in "aeiou":
-            return "an " + word
-        return "a " + word
-
-    # Bracket with various bracket types
-    if modifier == "bracket":
-        return bracket(word, params[0])
-
-    # Number to words
-    if modifier in ("num2word", "num2words"):
-        return sentence_case(number_as_text(word))
-
-    # Reverse string
-    if modifier == "reverse":
-        return word[::-1]
-
-    # Uppercase
-    if modifier in ("ucase", "uppercase"):
-        return word.upper()
-
-    # Lowercase
-    if modifier in ("lcase", "lowercase"):
-        return word.lower()
-
-    # Proper case (capitalize each word)
-    if modifier == "propercase":
-        return word.title()
-
-    # Sentence case
-    if modifier == "sentencecase":
-        return sentence_case(word)
-
-    # Obscure (leet speak)
-    if modifier == "obscure":
-        return obscure(word)
-
-    # Replace
-    if modifier == "replace":
-        return word.replace(params[0], params[1])
-
-    # Random case
-    if modifier == "randomcase":
-        return random_case(word)
-
-    # Scramble letters
-    if modifier == "scramble":
-        times = int(params[0]) if params[0] else 1
-        return scramble_word(word, times)
-
-    # Pig latin
-    if modifier == "piglatin":
-        return pig_latin(word)
-
-    # Repeat
-    if modifier == "repeat":
-        times = int(params[0]) if params[0] else 1
-        return word * (times + 1)
-
-    # Right substring
-    if modifier == "right":
-        length = int(params[0]) if params[0] else len(word)
-        return word[-length:]
-
-    # Left substring
-    if modifier == "left":
-        length = int(params[0]) if params[0] else len(word)
-        return word[:length]
-
-    # Trim whitespace
-    if modifier == "trim":
-        return word.strip()
-
-    # Format (for numbers)
-    if modifier == "format":
-        try:
-            fmt = params[0] if params[0] else "0"
-            # Convert VB format to Python (basic support)
-            if "0" in fmt:
-                width = fmt.count("0")
-                return word.zfill(width)
-            return word
-        except Exception:
-            return word
-
-    # Mid substring
-    if modifier == "mid":
-        start = int(params[0]) if params[0] else 1
-        length = int(params[1]) if params[1] else 1
-        return word[start-1:start-1+length]
-
-    # Swap first letters of two words
-    if modifier == "swap":
-        return swap_initials(word)
-
-    # Roman numeral
-    if modifier == "romannumeral":
-        try:
-            return to_roman(int(word))
-        except ValueError:
-            return word
-
-    # Hide (return empty string)
-    if modifier == "hide":
-        return ""
-
-    # Quote
-    if modifier == "quote":
-        return '"' + word + '"'
-
-    # Stutter
-    if modifier == "stutter":
-        return stutter(word)
-
-    # Random modifier
-    if modifier == "random":
-        random_mod = pick_one("bracket num2words randomcase reverse obscure piglatin scramble swap")
-        return apply_modifier(word, random_mod, params)
-
-    # Unknown modifier - return word unchanged (or raise error)
-    raise ValueError(f"Unknown modifier: {modifier}")
+        # Ensure we have exactly 4 parameters
+        count = len(params)
+        if count < 4:
+            params = tuple(params) + _EMPTY_PARAMS[count:]
+        elif count > 4:
+            params = tuple(params[:4])
+
+    # Names from the parser are already lowercase and stripped, so try
+    # the table directly before paying for the normalizing copies.
+    handler = _MODIFIERS.get(modifier_name)
+    if handler is None:
+        modifier = modifier_name.lower().strip()
+        handler = _MODIFIERS.get(modifier)
+        if handler is None:
+            # Unknown modifier
+            raise ValueError(f"Unknown modifier: {modifier}")
+
+    return handler(word, params)
+
+
+# Default bracket pairs, pre-split once (duplicates keep the original
+# weighting toward parentheses).
+_DEFAULT_BRACKETS = tuple(
+    "[ ] < > ( ) ( ) ( ) ( ) ( ) ( ) ( ) ( ) [ ] [ ] | | \\ / * * "
+    "[ ] { } / / \\ / / \\ \\ \\ <- -> -> <-".split(" ")
+)
 
 
 def bracket(word, bracket_list=""):
@@ -169,14 +195,43 @@ def bracket(word, bracket_list=""):
         Bracketed word.
     """
     if not bracket_list:
-        bracket_list = "[ ] < > ( ) ( ) ( ) ( ) ( ) ( ) ( ) ( ) [ ] [ ] | | \\ / * * [ ] { } / / \\ / / \\ \\ \\ <- -> -> <-"
-
-    brackets = bracket_list.split(" ")
+        brackets = _DEFAULT_BRACKETS
+    else:
+        brackets = bracket_list.split(" ")
     if len(brackets) < 2:
         return word
 
     x = int(rand(len(brackets) // 2 - 1, 0)) * 2
-    return brackets[x] + word + brackets[x + 1]
+    return f"{brackets[x]}{word}{brackets[x + 1]}"
+
+
+# Leet-speak substitution rules for obscure(): (pattern, replacement).
+# Hoisted to module scope so the table is built once, not per call.
+_OBSCURE_RULES = (
+    ("ate", "8"), ("for", "4"), ("e", "3"), ("l", "1"), ("s", "z"),
+    ("o", "0"), ("a", "@"), ("s", "$"), ("l", "|"), ("ait", "8"),
+    ("a", ""), ("e", ""), ("ou", "u"), ("cc", "x"), ("oo", "ew"),
+    ("and", "&"), ("are", "r"), ("ks", "x"), ("f", "ph"), ("ph", "f"),
+    ("won", "1"), ("l", "r"), ("ee", "eee"), ("000", "k"), ("er", "r"),
+    ("ex", "x"), ("ecs", "x"), ("m", "mm"), ("cke", "x0"), ("qu", "kw"),
+    ("a", "'"), ("u", "'"), ("ei", "ee"), ("one", "own"), ("oi", "oy"),
+    ("om", "um"), ("a", "aa"), ("ew", "u"), ("us", "is"), ("y", "ee"),
+    ("sh", "ch"), ("to", "2"), ("s", "th"), ("ck", "q"), ("ci", "si"),
+    ("ie", "iye"), ("tion", "shun"), ("r", "w"), ("come", "cum"),
+    ("cks", "x"), ("ight", "ite"), ("ing", "'n"), ("th", "f"),
+    ("too", "2"), ("why", "y"), ("your", "yor"), ("sc", "sh"),
+    ("sh", "th"), ("ly", "lee"), ("er", "uh"), ("er", "a"),
+    ("the", "da"), ("it is", "'tis"), ("you", "ya"), ("l", "w"),
+    ("th", "d"), ("a", "u"), ("th", "'"), ("your", "yer"),
+    ("ned", "nt"), ("e", "_"), ("t", "+"), ("e", "="), ("can", "kin"),
+    ("t", "'"), ("ng", "n'"), ("red", "hed"), ("he", "eh"), ("h", ""),
+    ("f", "v"), ("ha", "o"), ("v", "f"), ("v", "b"), ("N", "|\\|"),
+    ("ll", "dd"), ("ll", "tt"), ("dd", "tt"), ("h", "'"), ("o", "a"),
+    ("e", "a"), ("a", "uh"), ("a", "u"), ("oo", "u"), ("i", "ih"),
+    ("a ", "ah"), ("s", "ss"), ("t", "tt"), ("d", "dd"), ("at", "@"),
+    (" ", ""), ("with", "w/"), ("t", "d"), ("t", "dd"), ("d", "t"),
+    ("d", "tt"), ("cks", "x"), ("er", "ah"),
+)
 
 
 def obscure(word):
@@ -190,41 +245,17 @@ def obscure(word):
     """
     result = word
 
-    # Substitution rules: (pattern, replacement, case_number)
-    rules = [
-        ("ate", "8"), ("for", "4"), ("e", "3"), ("l", "1"), ("s", "z"),
-        ("o", "0"), ("a", "@"), ("s", "$"), ("l", "|"), ("ait", "8"),
-        ("a", ""), ("e", ""), ("ou", "u"), ("cc", "x"), ("oo", "ew"),
-        ("and", "&"), ("are", "r"), ("ks", "x"), ("f", "ph"), ("ph", "f"),
-        ("won", "1"), ("l", "r"), ("ee", "eee"), ("000", "k"), ("er", "r"),
-        ("ex", "x"), ("ecs", "x"), ("m", "mm"), ("cke", "x0"), ("qu", "kw"),
-        ("a", "'"), ("u", "'"), ("ei", "ee"), ("one", "own"), ("oi", "oy"),
-        ("om", "um"), ("a", "aa"), ("ew", "u"), ("us", "is"), ("y", "ee"),
-        ("sh", "ch"), ("to", "2"), ("s", "th"), ("ck", "q"), ("ci", "si"),
-        ("ie", "iye"), ("tion", "shun"), ("r", "w"), ("come", "cum"),
-        ("cks", "x"), ("ight", "ite"), ("ing", "'n"), ("th", "f"),
-        ("too", "2"), ("why", "y"), ("your", "yor"), ("sc", "sh"),
-        ("sh", "th"), ("ly", "lee"), ("er", "uh"), ("er", "a"),
-        ("the", "da"), ("it is", "'tis"), ("you", "ya"), ("l", "w"),
-        ("th", "d"), ("a", "u"), ("th", "'"), ("your", "yer"),
-        ("ned", "nt"), ("e", "_"), ("t", "+"), ("e", "="), ("can", "kin"),
-        ("t", "'"), ("ng", "n'"), ("red", "hed"), ("he", "eh"), ("h", ""),
-        ("f", "v"), ("ha", "o"), ("v", "f"), ("v", "b"), ("N", "|\\|"),
-        ("ll", "dd"), ("ll", "tt"), ("dd", "tt"), ("h", "'"), ("o", "a"),
-        ("e", "a"), ("a", "uh"), ("a", "u"), ("oo", "u"), ("i", "ih"),
-        ("a ", "ah"), ("s", "ss"), ("t", "tt"), ("d", "dd"), ("at", "@"),
-        (" ", ""), ("with", "w/"), ("t", "d"), ("t", "dd"), ("d", "t"),
-        ("d", "tt"), ("cks", "x"), ("er", "ah"),
-    ]
-
     # Apply 2-20 random substitutions
     max_attempts = rand(20, 2, 2)
     for i in range(max_attempts):
-        rule_index = rand(len(rules) - 1, 0)
-        old, new = rules[rule_index]
+        rule_index = rand(len(_OBSCURE_RULES) - 1, 0)
+        old, new = _OBSCURE_RULES[rule_index]
 
-        if old in result:
-            result = result.replace(old, new, 1)
+        # One find locates the match and drives the splice, instead of
+        # an "in" scan followed by a second scan inside replace()
+        idx = result.find(old)
+        if idx != -1:
+            result = result[:idx] + new + result[idx + len(old):]
 
         # If we've made changes, maybe exit early
         if i >= 2 and result != word and chance(75):
@@ -233,80 +264,121 @@ def obscure(word):
     return result
 
 
-def random_case(word):
-    """Apply random capitalization to a word.
+# Case-flip translation tables for random_case, built once.
+_VOWEL_UPPER_TRANS = str.maketrans("aeiou", "AEIOU")
+_CONSONANT_UPPER_TRANS = str.maketrans(
+    "bcdfghjklmnpqrstvwxyz", "BCDFGHJKLMNPQRSTVWXYZ"
+)
 
-    Args:
-        word: Word to transform.
 
-    Returns:
-        Word with random case.
-    """
-    from pyfwert.constants import VOWELS, CONSONANTS
+def _rc_unchanged(word):
+    return word
 
-    choice = rand(14, 0)
 
-    if choice == 0:
-        # Do nothing
-        return word
+def _rc_upper(word):
+    return word.upper()
+
+
+def _rc_lower(word):
+    return word.lower()
+
+
+def _rc_title(word):
+    return word.title()
+
+
+def _rc_one_letter_all(word):
+    # Pick one letter and uppercase all occurrences
+    letter = word[rand(len(word) - 1, 0)]
+    return word.replace(letter, letter.upper())
+
+
+def _rc_totally_random(word):
+    # One batched draw supplies a flip bit per character
+    bits = secrets.randbits(len(word))
+    return "".join(
+        c.upper() if (bits >> i) & 1 else c for i, c in enumerate(word)
+    )
+
+
+def _rc_one_random(word):
+    # Uppercase one random character
+    i = rand(len(word) - 1, 0)
+    return word[:i] + word[i].upper() + word[i+1:]
+
 
-    elif choice == 1:
-        # All upper
-        return word.upper()
+def _rc_vowels(word):
+    # Vowels uppercase
+    return word.translate(_VOWEL_UPPER_TRANS)
 
-    elif choice == 2:
-        # All lower
-        return word.lower()
 
-    elif choice == 3:
-        # Title case
-        return word.title()
+def _rc_consonants(word):
+    # Consonants uppercase
+    return word.translate(_CONSONANT_UPPER_TRANS)
 
-    elif choice == 4:
-        # Pick one letter and uppercase all occurrences
-        letter = word[rand(len(word) - 1, 0)]
-        return word.replace(letter, letter.upper())
 
-    elif choice == 5:
-        # Totally random
-        return "".join(c.upper() if rand(1) else c for c in word)
+def _rc_two_consecutive(word):
+    # Two consecutive letters uppercase
+    i = rand(len(word) - 2, 0)
+    return word[:i] + word[i:i+2].upper() + word[i+2:]
 
-    elif choice in (6, 7):
-        # Uppercase one random character
-        i = rand(len(word) - 1, 0)
-        return word[:i] + word[i].upper() + word[i+1:]
 
-    elif choice == 8:
-        # Vowels uppercase
-        return "".join(c.upper() if c.lower() in VOWELS else c for c in word)
+def _rc_last(word):
+    # Last letter uppercase
+    return word[:-1] + word[-1].upper()
 
-    elif choice == 9:
-        # Consonants uppercase
-        return "".join(c.upper() if c.lower() in CONSONANTS else c for c in word)
 
-    elif choice == 10:
-        # Two consecutive letters uppercase
-        i = rand(len(word) - 2, 0)
-        return word[:i] + word[i:i+2].upper() + word[i+2:]
+def _rc_first_and_last(word):
+    # First and last letters uppercase
+    if len(word) >= 2:
+        return word[0].upper() + word[1:-1] + word[-1].upper()
+    return word.upper()
 
-    elif choice == 11:
-        # Last letter uppercase
-        return word[:-1] + word[-1].upper()
 
-    elif choice == 12:
-        # First and last letters uppercase
-        if len(word) >= 2:
-            return word[0].upper() + word[1:-1] + word[-1].upper()
-        return word.upper()
+def _rc_first_x(word):
+    # First x letters uppercase
+    x = rand(len(word), 1, 2)
+    return word[:x].upper() + word[x:]
 
-    elif choice == 13:
-        # First x letters uppercase
-        x = rand(len(word), 1, 2)
-        return word[:x].upper() + word[x:]
 
-    else:  # choice == 14
-        # Every other letter uppercase
-        return "".join(c.upper() if i % 2 == 0 else c for i, c in enumerate(word))
+def _rc_alternating(word):
+    # Every other letter uppercase
+    return "".join(
+        c.upper() if i % 2 == 0 else c for i, c in enumerate(word)
+    )
+
+
+# Branch table indexed by the random choice (choices 6 and 7 share a
+# handler, as in the original elif ladder).
+_RANDOM_CASE_CHOICES = (
+    _rc_unchanged,
+    _rc_upper,
+    _rc_lower,
+    _rc_title,
+    _rc_one_letter_all,
+    _rc_totally_random,
+    _rc_one_random,
+    _rc_one_random,
+    _rc_vowels,
+    _rc_consonants,
+    _rc_two_consecutive,
+    _rc_last,
+    _rc_first_and_last,
+    _rc_first_x,
+    _rc_alternating,
+)
+
+
+def random_case(word):
+    """Apply random capitalization to a word.
+
+    Args:
+        word: Word to transform.
+
+    Returns:
+        Word with random case.
+    """
+    return _RANDOM_CASE_CHOICES[rand(14, 0)](word)
 
 
 def scramble_word(word, times=1):
@@ -323,9 +395,22 @@ def scramble_word(word, times=1):
         return word
 
     chars = list(word)
-    for _ in range(times):
-        x1 = rand(len(chars) - 1, 0)
-        x2 = rand(len(chars) - 1, 0)
+
+    # Enough swaps approximate a full permutation anyway, so do it in
+    # one Fisher-Yates pass instead of 2*times index draws. shuffle()
+    # already runs the Fisher-Yates loop in C against the CSPRNG, so a
+    # JIT-compiled version would only relocate work that is not the
+    # bottleneck here.
+    if times >= len(chars):
+        _sysrand.shuffle(chars)
+        return "".join(chars)
+
+    # Draw all swap indices in one batched call instead of two rand()
+    # calls per swap
+    indexes = _sysrand.choices(range(len(chars)), k=2 * times)
+    for k in range(0, 2 * times, 2):
+        x1 = indexes[k]
+        x2 = indexes[k + 1]
         chars[x1], chars[x2] = chars[x2], chars[x1]
 
     return "".join(chars)
@@ -348,16 +433,14 @@ def pig_latin(text):
             result.append(word)
             continue
 
-        first_char = word[0].lower()
-
-        if first_char in "aeiou":
+        if word[0] in _VOWEL_FIRST:
             converted = word + "yay"
         else:
             converted = word[1:] + word[0] + "ay"
 
         # Preserve original capitalization
         if word[0].isupper():
-            converted = converted[0].upper() + converted[1:].lower()
+            converted = converted.capitalize()
 
         result.append(converted)
 
@@ -405,11 +488,15 @@ def stutter(word):
             first_part = word[:i+1]
             stuttered = word
 
+            # One draw supplies both percent checks (independent base-100
+            # digits)
+            draw = _sysrand.randrange(10000)
+
             # Maybe add ellipsis
-            if rand(100) < 5:
+            if draw % 100 < 5:
                 first_part += "..."
             # Maybe add space
-            if rand(100) < 10:
+            if draw // 100 < 10:
                 first_part += " "
 
             # Repeat 1-4 times
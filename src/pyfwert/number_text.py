@@ -3,6 +3,12 @@
 Ported from VB6 NumText.bas by Frederick Rothstein.
 """
 
+import re
+
+# Optionally signed integer or decimal, with optional comma grouping.
+# The lookahead insists on at least one digit so "." and "" fail.
+_NUM_RE = re.compile(r"^[+-]?(?=\.?\d)(?:\d{1,3}(?:,\d{3})+|\d*)(?:\.\d*)?$")
+
 # Number word lookup table
 NUMBER_TEXT = [
     "Zero", "One", "Two", "Three", "Four", "Five", "Six", "Seven",
@@ -11,6 +17,9 @@ NUMBER_TEXT = [
     "Thirty", "Forty", "Fifty", "Sixty", "Seventy", "Eighty", "Ninety"
 ]
 
+# Digit words indexed by ord(char) - 48 for the decimal-part loop.
+_DIGIT_WORDS = tuple(NUMBER_TEXT[:10])
+
 
 def _hundreds_tens_units(value, use_and=False):
     """Convert a number 0-999 to words.
@@ -22,26 +31,29 @@ def _hundreds_tens_units(value, use_and=False):
     Returns:
         String representation of the number.
     """
-    result = ""
+    parts = []
     test_value = int(value)
 
     if test_value > 99:
         cardinal = test_value // 100
-        result = NUMBER_TEXT[cardinal] + " Hundred "
+        parts.append(NUMBER_TEXT[cardinal])
+        parts.append("Hundred")
         test_value = test_value - (cardinal * 100)
 
     if use_and:
-        result += "and "
+        parts.append("and")
 
     if test_value > 20:
         cardinal = test_value // 10
-        result += NUMBER_TEXT[cardinal + 18] + " "
+        parts.append(NUMBER_TEXT[cardinal + 18])
         test_value = test_value - (cardinal * 10)
 
     if test_value > 0:
-        result += NUMBER_TEXT[test_value] + " "
+        parts.append(NUMBER_TEXT[test_value])
 
-    return result
+    if not parts:
+        return ""
+    return " ".join(parts) + " "
 
 
 def number_as_text(number_in):
@@ -61,10 +73,8 @@ def number_as_text(number_in):
     """
     number_str = str(number_in).strip()
 
-    # Check for valid number
-    try:
-        float(number_str.replace(",", ""))
-    except ValueError:
+    # Check for valid number without paying for a throwaway float parse
+    if not _NUM_RE.match(number_str):
         return "Error - Number improperly formed"
 
     # Handle sign
@@ -76,14 +86,15 @@ def number_as_text(number_in):
         number_sign = "Plus "
         number_str = number_str[1:]
 
+    # Strip comma grouping once for both branches below
+    number_str = number_str.replace(",", "")
+
     # Handle decimal point
     decimal_part = ""
     if "." in number_str:
-        parts = number_str.split(".")
-        whole_part = parts[0].replace(",", "")
-        decimal_part = parts[1]
+        whole_part, decimal_part = number_str.split(".", 1)
     else:
-        whole_part = number_str.replace(",", "")
+        whole_part = number_str
 
     # Handle very large numbers
     big_whole_part = ""
@@ -94,7 +105,14 @@ def number_as_text(number_in):
     if len(big_whole_part) > 9:
         return "Error - Number too large"
 
-    result = ""
+    # Small whole numbers (the common case for passwords) come straight
+    # from the precomputed table
+    if not big_whole_part and not decimal_part:
+        test_value = int(whole_part) if whole_part else 0
+        if test_value < 1000:
+            return number_sign + _SMALL[test_value]
+
+    out = []
 
     # Very large values (billions and up)
     if big_whole_part:
@@ -102,42 +120,55 @@ def number_as_text(number_in):
 
         if test_value > 999999:
             cardinal = test_value // 1000000
-            result = _hundreds_tens_units(cardinal) + "Quadrillion "
+            out.append(_hundreds_tens_units(cardinal) + "Quadrillion ")
             test_value = test_value - (cardinal * 1000000)
 
         if test_value > 999:
             cardinal = test_value // 1000
-            result += _hundreds_tens_units(cardinal) + "Trillion "
+            out.append(_hundreds_tens_units(cardinal) + "Trillion ")
             test_value = test_value - (cardinal * 1000)
 
         if test_value > 0:
-            result += _hundreds_tens_units(test_value) + "Billion "
+            out.append(_hundreds_tens_units(test_value) + "Billion ")
 
     # Regular values (up to 999,999,999)
     test_value = int(whole_part) if whole_part else 0
 
     if test_value == 0 and not big_whole_part:
-        result = "Zero "
+        out.append("Zero ")
 
     if test_value > 999999:
         cardinal = test_value // 1000000
-        result += _hundreds_tens_units(cardinal) + "Million "
+        out.append(_hundreds_tens_units(cardinal) + "Million ")
         test_value = test_value - (cardinal * 1000000)
 
     if test_value > 999:
         cardinal = test_value // 1000
-        result += _hundreds_tens_units(cardinal) + "Thousand "
+        out.append(_hundreds_tens_units(cardinal) + "Thousand ")
         test_value = test_value - (cardinal * 1000)
 
     if test_value > 0:
         use_and = int(whole_part) >= 100 or bool(big_whole_part)
-        result += _hundreds_tens_units(test_value, use_and)
+        out.append(_hundreds_tens_units(test_value, use_and))
 
     # Handle decimal portion
     if decimal_part:
-        result += "Point"
-        for digit in decimal_part:
-            if digit.isdigit():
-                result += " " + NUMBER_TEXT[int(digit)]
-
-    return number_sign + result.strip()
+        out.append("Point")
+        # ord arithmetic with an ASCII range guard is cheaper per digit
+        # than int() plus the Unicode-aware str.isdigit
+        digit_words = " ".join(
+            _DIGIT_WORDS[ord(digit) - 48]
+            for digit in decimal_part
+            if "0" <= digit <= "9"
+        )
+        if digit_words:
+            out.append(" " + digit_words)
+
+    return number_sign + "".join(out).strip()
+
+
+# Words for 0-999, built once at import; entries of 100 and up carry the
+# same "and" that the general path inserts for three-digit numbers.
+_SMALL = ("Zero",) + tuple(
+    _hundreds_tens_units(i, i >= 100).strip() for i in range(1, 1000)
+)
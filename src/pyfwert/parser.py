@@ -3,12 +3,32 @@
 Ported from VB6 ParsePattern() in PafwertLib.cls.
 """
 
+import re
+from functools import lru_cache
+
 from pyfwert.constants import ESCAPE_SEQUENCES
 
 
+# Single alternation over all escape sequences (longest-first), so
+# escaping is one compiled scan instead of one replace pass per sequence.
+_ESCAPE_RE = re.compile(
+    "|".join(re.escape(seq) for seq in sorted(ESCAPE_SEQUENCES, key=len, reverse=True))
+)
+
+
+# Placeholder/modifier content of the usual shape: name, optional
+# (params), optional [N] qualifier - captured in one match.
+_CONTENT_PARSE_RE = re.compile(r"^([^([]+)(?:\(([^)]*)\))?(?:\[(\d+)\])?$")
+
+
 class Placeholder:
     """Represents a placeholder in a pattern."""
 
+    __slots__ = (
+        "original_pattern", "normalized_pattern", "completed_pattern",
+        "parent", "start", "index",
+    )
+
     def __init__(self):
         self.original_pattern = ""
         self.normalized_pattern = ""
@@ -18,6 +38,10 @@ class Placeholder:
         self.index = 0
 
 
+def _escape_sub(match, _table=ESCAPE_SEQUENCES):
+    return _table[match.group(0)]
+
+
 def escape_pattern(pattern):
     """Replace escape sequences with placeholder tokens.
 
@@ -26,21 +50,28 @@ def escape_pattern(pattern):
 
     Returns:
         Pattern with escape sequences replaced.
+
+    Escape sequences are multi-character ("\\{" and friends), so this
+    stays one precompiled alternation scan; str.translate only maps
+    single characters and cannot express these substitutions.
     """
-    result = pattern
-    for escape, token in ESCAPE_SEQUENCES.items():
-        result = result.replace(escape, token)
-    return result
+    # Every escape sequence starts with a backslash
+    if "\\" not in pattern:
+        return pattern
+    return _ESCAPE_RE.sub(_escape_sub, pattern)
 
 
+@lru_cache(maxsize=1024)
 def parse_pattern(pattern):
-    """Parse a pattern string into a list of placeholders.
+    """Parse a pattern string into a sequence of placeholders.
 
     Args:
         pattern: Pattern string (e.g., "{word}.{number}").
 
     Returns:
-        List of Placeholder objects representing the parsed pattern.
+        Tuple of Placeholder objects representing the parsed pattern.
+        Results are cached per pattern, so callers must treat the
+        placeholders as read-only.
 
     Raises:
         ValueError: If the pattern has mismatched braces.
@@ -56,12 +87,18 @@ def parse_pattern(pattern):
     placeholders = []
     position_stack = []
     placeholder_count = 0
-    master_pattern = ""
+
+    # Accumulate the master pattern as chunks and mutate the escaped
+    # text as a char list, so neither grows quadratically with pattern
+    # length the way repeated += / slice-rebuild did.
+    master_parts = []
+    escaped_chars = list(escaped)
 
     i = 0
-    while i < len(escaped):
-        char = escaped[i]
-        master_pattern += char
+    n = len(escaped_chars)
+    while i < n:
+        char = escaped_chars[i]
+        master_parts.append(char)
 
         if char == "{":
             position_stack.append(i)
@@ -72,10 +109,11 @@ def parse_pattern(pattern):
 
             placeholder_count += 1
             pattern_id = f"{placeholder_count:02d}"
-            master_pattern += pattern_id
+            master_parts.append(pattern_id)
 
-            # Replace the "00" padding with actual ID
-            escaped = escaped[:i+1] + pattern_id + escaped[i+3:]
+            # Replace the "00" padding with actual ID (in-place splice)
+            escaped_chars[i+1] = pattern_id[0]
+            escaped_chars[i+2] = pattern_id[1]
 
             # Create placeholder
             ph = Placeholder()
@@ -87,9 +125,9 @@ def parse_pattern(pattern):
             else:
                 ph.parent = -1
 
-            # Extract patterns from escaped string
-            ph.original_pattern = escaped[ph.start:i+3]  # Includes {, }, and ID
-            ph.normalized_pattern = escaped[ph.start+1:i]  # Content between { and }
+            # Extract patterns from escaped chars
+            ph.original_pattern = "".join(escaped_chars[ph.start:i+3])  # Includes {, }, and ID
+            ph.normalized_pattern = "".join(escaped_chars[ph.start+1:i])  # Content between { and }
 
             placeholders.append(ph)
 
@@ -98,6 +136,8 @@ def parse_pattern(pattern):
 
         i += 1
 
+    master_pattern = "".join(master_parts)
+
     # Add the master placeholder (the complete pattern)
     master = Placeholder()
     master.index = placeholder_count + 1
@@ -118,9 +158,10 @@ def parse_pattern(pattern):
                     ph.parent = other.index
                     break
 
-    return placeholders
+    return tuple(placeholders)
 
 
+@lru_cache(maxsize=1024)
 def check_pattern(pattern):
     """Check if a pattern is syntactically valid.
 
@@ -136,24 +177,14 @@ def check_pattern(pattern):
     # Apply escape sequences for checking
     test_pattern = escape_pattern(pattern)
 
-    # Count brackets, braces, and parentheses
-    counts = {
-        "{": 0, "}": 0,
-        "[": 0, "]": 0,
-        "(": 0, ")": 0,
-    }
-
-    for char in test_pattern:
-        if char in counts:
-            counts[char] += 1
-
-    if counts["{"] != counts["}"]:
+    # Count brackets, braces, and parentheses with C-level scans
+    if test_pattern.count("{") != test_pattern.count("}"):
         return "Error: Unmatched braces in pattern"
 
-    if counts["["] != counts["]"]:
+    if test_pattern.count("[") != test_pattern.count("]"):
         return "Error: Unmatched brackets in pattern"
 
-    if counts["("] != counts[")"]:
+    if test_pattern.count("(") != test_pattern.count(")"):
         return "Error: Unmatched parentheses in pattern"
 
     try:
@@ -164,6 +195,7 @@ def check_pattern(pattern):
     return ""
 
 
+@lru_cache(maxsize=1024)
 def parse_placeholder_content(content):
     """Parse the content of a placeholder into its components.
 
@@ -177,6 +209,9 @@ def parse_placeholder_content(content):
             - modifiers: List of (modifier_name, params, qualifier) tuples
             - qualifier: Optional percentage qualifier
             - alternatives: List of alternatives if using | separator
+
+        Results are cached per content string, so callers must treat
+        the returned dict as read-only.
     """
     result = {
         "name": "",
@@ -188,19 +223,35 @@ def parse_placeholder_content(content):
 
     # Check for alternatives (pipe separator), but not inside parentheses
     # e.g., "a|b|c" -> alternatives, but "Word(a|b)" -> NOT alternatives
-    alternatives = _split_by_pipe(content)
+    alternatives = _split_top_level(content, "|")
     if len(alternatives) > 1:
-        result["alternatives"] = alternatives
+        # Tuple, not list: the parse is cached and the generator feeds
+        # this straight to choice(), so immutable C-indexed storage is
+        # the right shape.
+        result["alternatives"] = tuple(alternatives)
         return result
 
     # First split by + to separate base from modifiers
     # We need to be careful not to split inside parentheses
-    parts = _split_by_plus(content)
+    parts = _split_top_level(content, "+")
     base = parts[0]
     modifier_parts = parts[1:]
 
     # Parse modifiers first (each can have its own qualifier)
     for mod in modifier_parts:
+        match = _CONTENT_PARSE_RE.match(mod)
+        if match:
+            # Common shape: one match extracts all three pieces
+            mod_name, param_str, qual = match.groups()
+            if param_str is not None:
+                mod_params = [p.strip().strip('"') for p in param_str.split(",")]
+            else:
+                mod_params = []
+            mod_qualifier = int(qual) if qual else None
+            result["modifiers"].append((mod_name, mod_params, mod_qualifier))
+            continue
+
+        # Fall back to incremental parsing for unusual orderings
         mod_name = mod
         mod_params = []
         mod_qualifier = None
@@ -229,6 +280,16 @@ def parse_placeholder_content(content):
         result["modifiers"].append((mod_name, mod_params, mod_qualifier))
 
     # Now parse the base (name, params, and qualifier)
+    match = _CONTENT_PARSE_RE.match(base)
+    if match:
+        name, param_str, qual = match.groups()
+        result["name"] = name.strip()
+        if param_str is not None:
+            result["params"] = [p.strip().strip('"') for p in param_str.split(",")]
+        result["qualifier"] = int(qual) if qual else None
+        return result
+
+    # Fall back to incremental parsing for unusual orderings
     # Check for qualifier [N] on base
     qualifier_start = base.find("[")
     if qualifier_start != -1:
@@ -256,65 +317,48 @@ def parse_placeholder_content(content):
     return result
 
 
-def _split_by_plus(content):
-    """Split content by + but not inside parentheses.
+def _split_top_level(content, delim):
+    """Split content by a delimiter, ignoring delimiters inside parentheses.
 
     Args:
         content: String to split.
+        delim: Single-character delimiter ("+" or "|").
 
     Returns:
         List of parts.
-    """
-    parts = []
-    current = ""
-    depth = 0
-
-    for char in content:
-        if char == "(":
-            depth += 1
-            current += char
-        elif char == ")":
-            depth -= 1
-            current += char
-        elif char == "+" and depth == 0:
-            parts.append(current)
-            current = ""
-        else:
-            current += char
-
-    if current:
-        parts.append(current)
-
-    return parts if parts else [content]
-
 
-def _split_by_pipe(content):
-    """Split content by | but not inside parentheses.
-
-    Args:
-        content: String to split.
-
-    Returns:
-        List of parts.
+    Jumps between interesting characters with C-level find calls rather
+    than walking every character in Python.
     """
     parts = []
-    current = ""
+    start = 0
     depth = 0
-
-    for char in content:
-        if char == "(":
+    i = 0
+    n = len(content)
+    find = content.find
+
+    while i < n:
+        # Jump to the next character that can affect splitting
+        j = n
+        for ch in (delim, "(", ")"):
+            k = find(ch, i, j)
+            if k != -1:
+                j = k
+        if j == n:
+            break
+
+        ch = content[j]
+        if ch == "(":
             depth += 1
-            current += char
-        elif char == ")":
+        elif ch == ")":
             depth -= 1
-            current += char
-        elif char == "|" and depth == 0:
-            parts.append(current)
-            current = ""
-        else:
-            current += char
-
-    if current:
-        parts.append(current)
+        elif depth == 0:
+            parts.append(content[start:j])
+            start = j + 1
+        i = j + 1
+
+    tail = content[start:]
+    if tail:
+        parts.append(tail)
 
     return parts if parts else [content]
@@ -3,13 +3,160 @@
 Ported from VB6 GetWord() in PafwertLib.cls.
 """
 
+from pyfwert.modifiers import bracket
 from pyfwert.random import rand, chance
-from pyfwert.utils import pick_one, pick_character, get_ordinal, get_phonetic
+from pyfwert.utils import (
+    pick_one, pick_character, pick_characters, get_ordinal, get_phonetic,
+)
 from pyfwert.pronounceable import pronounceable_word
 from pyfwert.wordlists import random_word
 from pyfwert import constants
 
 
+# Shared padding for placeholder parameters (immutable, allocated once).
+_EMPTY_PARAMS = ("", "", "", "")
+
+
+def _h_word(params, wordlist_dir, keywords):
+    """Random word from a wordlist."""
+    wordlist = params[0] if params[0] else "4-letter"
+    # Handle alternatives in wordlist parameter (e.g., "Verb|babysound")
+    if "|" in wordlist:
+        wordlist = pick_one(wordlist.split("|"), delimiter="|")
+    return random_word(wordlist, wordlist_dir)
+
+
+def _h_vowel(params, wordlist_dir, keywords, _chars=constants.VOWELS,
+             _pick=pick_characters):
+    """One or more random vowels."""
+    count = int(params[0]) if params[0] else 1
+    return _pick(_chars, count)
+
+
+def _h_consonant(params, wordlist_dir, keywords, _chars=constants.CONSONANTS,
+                 _pick=pick_characters):
+    """One or more random consonants."""
+    count = int(params[0]) if params[0] else 1
+    return _pick(_chars, count)
+
+
+def _h_number(params, wordlist_dir, keywords):
+    """Random number with optional max/min/weight/decimals."""
+    max_val = int(params[0]) if params[0] else 9
+    min_val = int(params[1]) if params[1] else 0
+    weight = int(params[2]) if params[2] else 1
+    decimal_places = int(params[3]) if params[3] else 0
+    return str(rand(max_val, min_val, weight, decimal_places))
+
+
+def _h_letter(params, wordlist_dir, keywords, _chars=constants.LETTERS,
+              _pick=pick_characters):
+    """One or more random letters."""
+    count = int(params[0]) if params[0] else 1
+    if count < 0:
+        count = abs(count)
+    return _pick(_chars, count)
+
+
+def _h_sequence(params, wordlist_dir, keywords):
+    """Keyboard sequence of a given length."""
+    length = int(params[0]) if params[0] else 3
+    return get_sequence(length)
+
+
+def _h_ordinal(params, wordlist_dir, keywords):
+    """Ordinal form of a given or random number."""
+    num = int(params[0]) if params[0] else rand(99, 1)
+    return get_ordinal(num)
+
+
+def _h_phonetic(params, wordlist_dir, keywords):
+    """Phonetic-alphabet word for a letter."""
+    word = params[0] if params[0] else pick_character(constants.LETTERS)
+    style = int(params[1]) if params[1] else 1
+    return get_phonetic(word, style)
+
+
+def _h_number_pattern(params, wordlist_dir, keywords):
+    """Patterned number sequence of a given length."""
+    length = int(params[0]) if params[0] else 3
+    return get_number_pattern(length)
+
+
+def _h_asc(params, wordlist_dir, keywords):
+    """ASCII code for a character, or a random printable code."""
+    if params[0]:
+        return str(ord(params[0][0]))
+    return str(rand(255, 32))
+
+
+def _h_chr(params, wordlist_dir, keywords):
+    """Printable character for an ASCII code."""
+    if params[0]:
+        try:
+            code = int(params[0])
+            if 32 <= code <= 126:
+                return chr(code)
+        except ValueError:
+            pass
+    return ""
+
+
+def _picker(chars, _pick=pick_character):
+    """Handler drawing one character from a fixed set.
+
+    The set and picker are bound as defaults so the call reads them
+    with LOAD_FAST instead of a global + attribute lookup.
+    """
+    return lambda params, wd, kw, _c=chars, _p=_pick: _p(_c)
+
+
+def _lister(items, _pick=pick_one):
+    """Handler picking one item from a fixed pre-split list."""
+    return lambda params, wd, kw, _i=items, _p=_pick: _p(_i)
+
+
+# Dispatch table mapping placeholder names (including aliases) to
+# handlers, so lookup is one hash probe instead of a linear comparison
+# chain - same shape as _MODIFIERS in modifiers.py.
+_PLACEHOLDERS = {
+    "word": _h_word,
+    "sp": lambda params, wd, kw: " ",
+    "space": lambda params, wd, kw: " ",
+    "vowel": _h_vowel,
+    "consonant": _h_consonant,
+    "symbol": _lister(constants.SYMBOLS_LIST),
+    "endpunctuation": _lister(constants.END_PUNCTUATION_LIST),
+    "sentencepunctuation": _picker(constants.SENTENCE_PUNCTUATION),
+    "number": _h_number,
+    "letter": _h_letter,
+    "smiley": _lister(constants.SMILEYS_LIST),
+    "keyboard": _picker(constants.KEYBOARD),
+    "numrow": _picker(constants.NUMROW),
+    "numrowfull": _picker(constants.NUMROW_FULL),
+    "row1": _picker(constants.ROW1),
+    "row1full": _picker(constants.ROW1_FULL),
+    "row2": _picker(constants.ROW2),
+    "row2full": _picker(constants.ROW2_FULL),
+    "row3": _picker(constants.ROW3),
+    "row3full": _picker(constants.ROW3_FULL),
+    "lefthand": _picker(constants.LEFT_HAND),
+    "righthand": _picker(constants.RIGHT_HAND),
+    "sequence": _h_sequence,
+    "ordinal": _h_ordinal,
+    "phonetic": _h_phonetic,
+    "pronounceable": lambda params, wd, kw: pronounceable_word(),
+    "numberpattern": _h_number_pattern,
+    "asc": _h_asc,
+    "chr": _h_chr,
+    "longmonth": _lister(constants.LONG_MONTHS_LIST),
+    "shortmonth": _lister(constants.SHORT_MONTHS_LIST),
+    "longday": _lister(constants.LONG_DAYS_LIST),
+    "shortday": _lister(constants.SHORT_DAYS_LIST),
+    "numbercode": lambda params, wd, kw: number_code(),
+}
+
+
 def resolve_placeholder(name, params=None, wordlist_dir=None, keywords=None):
     """Resolve a placeholder to its value.
 
@@ -23,164 +170,18 @@ def resolve_placeholder(name, params=None, wordlist_dir=None, keywords=None):
         The resolved value as a string.
     """
     if params is None:
-        params = ["", "", "", ""]
+        # Common no-params case shares one preallocated tuple
+        params = _EMPTY_PARAMS
     else:
-        params = list(params) + ["", "", "", ""]
-        params = params[:4]
+        # Pad to exactly 4 entries with one tuple allocation
+        it = iter(params)
+        params = (next(it, ""), next(it, ""), next(it, ""), next(it, ""))
 
     placeholder = name.lower().strip()
 
-    # Word from wordlist
-    if placeholder == "word":
-        wordlist = params[0] if params[0] else "4-letter"
-        # Handle alternatives in wordlist parameter (e.g., "Verb|babysound")
-        if "|" in wordlist:
-            wordlist = pick_one(wordlist.split("|"), delimiter="|")
-        return random_word(wordlist, wordlist_dir)
-
-    # Space
-    if placeholder in ("sp", "space"):
-        return " "
-
-    # Vowel
-    if placeholder == "vowel":
-        count = int(params[0]) if params[0] else 1
-        return "".join(pick_character(constants.VOWELS) for _ in range(count))
-
-    # Consonant
-    if placeholder == "consonant":
-        count = int(params[0]) if params[0] else 1
-        return "".join(pick_character(constants.CONSONANTS) for _ in range(count))
-
-    # Symbol
-    if placeholder == "symbol":
-        return pick_one(constants.SYMBOLS)
-
-    # End punctuation
-    if placeholder == "endpunctuation":
-        return pick_one(constants.END_PUNCTUATION)
-
-    # Sentence punctuation
-    if placeholder == "sentencepunctuation":
-        return pick_character(constants.SENTENCE_PUNCTUATION)
-
-    # Number
-    if placeholder == "number":
-        max_val = int(params[0]) if params[0] else 9
-        min_val = int(params[1]) if params[1] else 0
-        weight = int(params[2]) if params[2] else 1
-        decimal_places = int(params[3]) if params[3] else 0
-        return str(rand(max_val, min_val, weight, decimal_places))
-
-    # Letter
-    if placeholder == "letter":
-        count = int(params[0]) if params[0] else 1
-        if count < 0:
-            count = abs(count)
-        return "".join(pick_character(constants.LETTERS) for _ in range(count))
-
-    # Smiley
-    if placeholder == "smiley":
-        return pick_one(constants.SMILEYS)
-
-    # Keyboard character
-    if placeholder == "keyboard":
-        return pick_character(constants.KEYBOARD)
-
-    # Number row
-    if placeholder == "numrow":
-        return pick_character(constants.NUMROW)
-
-    if placeholder == "numrowfull":
-        return pick_character(constants.NUMROW_FULL)
-
-    # Keyboard rows
-    if placeholder == "row1":
-        return pick_character(constants.ROW1)
-
-    if placeholder == "row1full":
-        return pick_character(constants.ROW1_FULL)
-
-    if placeholder == "row2":
-        return pick_character(constants.ROW2)
-
-    if placeholder == "row2full":
-        return pick_character(constants.ROW2_FULL)
-
-    if placeholder == "row3":
-        return pick_character(constants.ROW3)
-
-    if placeholder == "row3full":
-        return pick_character(constants.ROW3_FULL)
-
-    # Hand positions
-    if placeholder == "lefthand":
-        return pick_character(constants.LEFT_HAND)
-
-    if placeholder == "righthand":
-        return pick_character(constants.RIGHT_HAND)
-
-    # Sequence
-    if placeholder == "sequence":
-        length = int(params[0]) if params[0] else 3
-        return get_sequence(length)
-
-    # Ordinal
-    if placeholder == "ordinal":
-        num = int(params[0]) if params[0] else rand(99, 1)
-        return get_ordinal(num)
-
-    # Phonetic
-    if placeholder == "phonetic":
-        word = params[0] if params[0] else pick_character(constants.LETTERS)
-        style = int(params[1]) if params[1] else 1
-        return get_phonetic(word, style)
-
-    # Pronounceable fake word
-    if placeholder == "pronounceable":
-        return pronounceable_word()
-
-    # Number pattern
-    if placeholder == "numberpattern":
-        length = int(params[0]) if params[0] else 3
-        return get_number_pattern(length)
-
-    # ASCII code
-    if placeholder == "asc":
-        if params[0]:
-            return str(ord(params[0][0]))
-        return str(rand(255, 32))
-
-    # Character from ASCII code
-    if placeholder == "chr":
-        if params[0]:
-            try:
-                code = int(params[0])
-                if 32 <= code <= 126:
-                    return chr(code)
-            except ValueError:
-                pass
-        return ""
-
-    # Long month name
-    if placeholder == "longmonth":
-        return pick_one(constants.LONG_MONTHS)
-
-    # Short month name
-    if placeholder == "shortmonth":
-        return pick_one(constants.SHORT_MONTHS)
-
-    # Long day name
-    if placeholder == "longday":
-        return pick_one(constants.LONG_DAYS)
-
-    # Short day name
-    if placeholder == "shortday":
-        return pick_one(constants.SHORT_DAYS)
-
-    # Number code (formatted number pattern)
-    if placeholder == "numbercode":
-        return number_code()
+    handler = _PLACEHOLDERS.get(placeholder)
+    if handler is not None:
+        return handler(params, wordlist_dir, keywords)
 
     # If not recognized, treat it as a wordlist name or literal
     try:
@@ -190,6 +191,88 @@ def resolve_placeholder(name, params=None, wordlist_dir=None, keywords=None):
         return name
 
 
+# Keyboard-sequence source strings, built once at module load.
+_SEQ_LETTERS = "abcdefghijklmnopqrstuvwxyz"
+_SEQ_NUMBERS = "1234567890"
+_SEQ_KEY1 = "qwertyuiop"
+_SEQ_KEY2 = "asdfghjkl"
+_SEQ_KEY3 = "zxcvbnm"
+_SEQ_KEY4 = "poiuytrewq"
+_SEQ_KEY5 = "lkjhgfdsa"
+_SEQ_KEY6 = "mnbvcxz"
+
+
+def _seq_slice(src, length):
+    """Contiguous run from one source row."""
+    start = rand(len(src) - length, 0)
+    return src[start:start + length]
+
+
+def _seq_rows(a, b, c, length):
+    """Same column range taken from three rows in order."""
+    i = rand(7, 1)
+    n = length // 3
+    return a[i:i + n] + b[i:i + n] + c[i:i + n]
+
+
+def _seq_interleave(a, b, max_start, length):
+    """Alternate characters from two rows, wrapping at the shorter."""
+    i = rand(max_start, 1)
+    limit = min(len(a), len(b))
+    parts = []
+    size = 0
+    while size < length:
+        if i < len(a) and i < len(b):
+            parts.append(a[i])
+            parts.append(b[i])
+            size += 2
+        i = (i + 1) % limit
+    return "".join(parts)
+
+
+def _seq_mirror(src, max_start, length):
+    """Pair characters from opposite ends of one row, walking inward."""
+    i = rand(max_start, 1)
+    n = len(src)
+    parts = []
+    size = 0
+    while size < length and i < n:
+        j = n - i - 1
+        if 0 <= j < n:
+            parts.append(src[i])
+            parts.append(src[j])
+            size += 2
+        i += 1
+    return "".join(parts)
+
+
+# Jump table indexed by rand(19); repeated entries keep the original
+# elif ladder's weighting (e.g. three chances for the key1/key2
+# interleave), and 0 shared the final else with 19.
+_SEQUENCE_CHOICES = (
+    lambda length: _seq_mirror(_SEQ_KEY3, 6, length),                    # 0
+    lambda length: _seq_slice(_SEQ_LETTERS, length),                     # 1
+    lambda length: _seq_slice(_SEQ_NUMBERS, length),                     # 2
+    lambda length: _seq_slice(_SEQ_KEY1, length),                        # 3
+    lambda length: _seq_slice(_SEQ_KEY2, length),                        # 4
+    lambda length: _seq_slice(_SEQ_KEY3, length),                        # 5
+    lambda length: _seq_slice(_SEQ_KEY4, length),                        # 6
+    lambda length: _seq_slice(_SEQ_KEY5, length),                        # 7
+    lambda length: _seq_slice(_SEQ_KEY6, length),                        # 8
+    lambda length: _seq_rows(_SEQ_KEY1, _SEQ_KEY2, _SEQ_KEY3, length),   # 9
+    lambda length: _seq_rows(_SEQ_KEY3, _SEQ_KEY2, _SEQ_KEY1, length),   # 10
+    lambda length: _seq_interleave(_SEQ_KEY1, _SEQ_KEY2, 8, length),     # 11
+    lambda length: _seq_interleave(_SEQ_KEY1, _SEQ_KEY2, 8, length),     # 12
+    lambda length: _seq_interleave(_SEQ_KEY1, _SEQ_KEY2, 8, length),     # 13
+    lambda length: _seq_interleave(_SEQ_KEY1, _SEQ_NUMBERS, 9, length),  # 14
+    lambda length: _seq_interleave(_SEQ_KEY4, _SEQ_KEY5, 8, length),     # 15
+    lambda length: _seq_interleave(_SEQ_KEY4, _SEQ_KEY5, 8, length),     # 16
+    lambda length: _seq_mirror(_SEQ_KEY1, 9, length),                    # 17
+    lambda length: _seq_mirror(_SEQ_KEY2, 8, length),                    # 18
+    lambda length: _seq_mirror(_SEQ_KEY3, 6, length),                    # 19
+)
+
+
 def get_sequence(length=3):
     """Generate a keyboard sequence.
 
@@ -199,108 +282,10 @@ def get_sequence(length=3):
     Returns:
         A keyboard sequence string.
     """
-    letters = "abcdefghijklmnopqrstuvwxyz"
-    numbers = "1234567890"
-    key1 = "qwertyuiop"
-    key2 = "asdfghjkl"
-    key3 = "zxcvbnm"
-    key4 = "poiuytrewq"
-    key5 = "lkjhgfdsa"
-    key6 = "mnbvcxz"
-
     if length <= 0:
         length = 3
 
-    choice = rand(19)
-    seq = ""
-
-    if choice == 1:
-        start = rand(len(letters) - length, 0)
-        seq = letters[start:start + length]
-
-    elif choice == 2:
-        start = rand(len(numbers) - length, 0)
-        seq = numbers[start:start + length]
-
-    elif choice == 3:
-        start = rand(len(key1) - length, 0)
-        seq = key1[start:start + length]
-
-    elif choice == 4:
-        start = rand(len(key2) - length, 0)
-        seq = key2[start:start + length]
-
-    elif choice == 5:
-        start = rand(len(key3) - length, 0)
-        seq = key3[start:start + length]
-
-    elif choice == 6:
-        start = rand(len(key4) - length, 0)
-        seq = key4[start:start + length]
-
-    elif choice == 7:
-        start = rand(len(key5) - length, 0)
-        seq = key5[start:start + length]
-
-    elif choice == 8:
-        start = rand(len(key6) - length, 0)
-        seq = key6[start:start + length]
-
-    elif choice == 9:
-        i = rand(7, 1)
-        n = length // 3
-        seq = key1[i:i+n] + key2[i:i+n] + key3[i:i+n]
-
-    elif choice == 10:
-        i = rand(7, 1)
-        n = length // 3
-        seq = key3[i:i+n] + key2[i:i+n] + key1[i:i+n]
-
-    elif choice in (11, 12, 13):
-        i = rand(min(8, len(key1) - 1, len(key2) - 1), 1)
-        while len(seq) < length:
-            if i < len(key1) and i < len(key2):
-                seq += key1[i] + key2[i]
-            i = (i + 1) % min(len(key1), len(key2))
-
-    elif choice == 14:
-        i = rand(9, 1)
-        while len(seq) < length:
-            if i < len(key1) and i < len(numbers):
-                seq += key1[i] + numbers[i]
-            i = (i + 1) % min(len(key1), len(numbers))
-
-    elif choice in (15, 16):
-        i = rand(min(8, len(key4) - 1, len(key5) - 1), 1)
-        while len(seq) < length:
-            if i < len(key4) and i < len(key5):
-                seq += key4[i] + key5[i]
-            i = (i + 1) % min(len(key4), len(key5))
-
-    elif choice == 17:
-        i = rand(9, 1)
-        while len(seq) < length and i < len(key1):
-            j = len(key1) - i - 1
-            if j >= 0 and j < len(key1):
-                seq += key1[i] + key1[j]
-            i += 1
-
-    elif choice == 18:
-        i = rand(8, 1)
-        while len(seq) < length and i < len(key2):
-            j = len(key2) - i - 1
-            if j >= 0 and j < len(key2):
-                seq += key2[i] + key2[j]
-            i += 1
-
-    else:
-        i = rand(6, 1)
-        while len(seq) < length and i < len(key3):
-            j = len(key3) - i - 1
-            if j >= 0 and j < len(key3):
-                seq += key3[i] + key3[j]
-            i += 1
-
+    seq = _SEQUENCE_CHOICES[rand(19)](length)
     return seq[:length]
 
 
@@ -316,31 +301,37 @@ def get_number_pattern(length=3):
     if length <= 0:
         length = 3
 
-    digits = [""] * (length + 1)
-    digits[1] = str(rand(9))
+    # Work on ASCII digit bytes directly; no int/str round-trip per
+    # digit and one decode at the end
+    buf = bytearray(length)
+    buf[0] = 0x30 + rand(9)
 
-    for i in range(2, length + 1):
+    for i in range(1, length):
         choice = rand(3, 0)
 
         if choice == 0:
-            digits[i] = str(rand(9))
+            buf[i] = 0x30 + rand(9)
         elif choice == 1:
-            digits[i] = digits[rand(i - 1, 1)]
+            buf[i] = buf[rand(i, 1) - 1]
         elif choice == 2:
-            prev = int(digits[i - 1]) if digits[i - 1] else 0
+            prev = buf[i - 1] - 0x30
             if prev > 1:
-                digits[i] = str(prev - 1)
+                buf[i] = buf[i - 1] - 1
             else:
-                digits[i] = str(rand(9))
+                buf[i] = 0x30 + rand(9)
         else:
-            prev = int(digits[i - 1]) if digits[i - 1] else 0
+            prev = buf[i - 1] - 0x30
             if prev < 9:
-                digits[i] = str(prev + 1)
+                buf[i] = buf[i - 1] + 1
             else:
-                digits[i] = str(rand(9))
+                buf[i] = 0x30 + rand(9)
+
+    return buf.decode("ascii")
+
 
-    result = "".join(digits[1:])
-    return result.zfill(length)
+# Pre-split delimiter choices for number_code (dashes repeated for
+# weighting), so pick_one skips the split on every call.
+_NUMBER_CODE_DELIMS = tuple("- - - - - - - - . . . , / \\ :".split(" "))
 
 
 def number_code():
@@ -350,7 +341,7 @@ def number_code():
         A formatted number code string.
     """
     repeat_digit = str(rand(9, 0))
-    delim = pick_one("- - - - - - - - . . . , / \\ :")
+    delim = pick_one(_NUMBER_CODE_DELIMS)
 
     code = ""
     while True:
@@ -374,7 +365,6 @@ def number_code():
             break
 
         if chance(10):
-            from pyfwert.modifiers import bracket
             code = bracket(code)
 
         if chance(15) and len(code) > 2:
@@ -3,9 +3,35 @@
 Ported from VB6 PronounceableWord() in Main.bas.
 """
 
+import re
+
 from pyfwert.random import rand
 from pyfwert.utils import pick_one
-from pyfwert.constants import VOWELS2, CONSONANTS2, CONSONANTS3
+from pyfwert.constants import VOWELS2_LIST, CONSONANTS2_LIST, CONSONANTS3_LIST
+
+
+# Doubled letters that should collapse, matched in one scan instead of
+# one replace pass per pair. The two functions double slightly
+# different sets ("qq" becomes "qu" in pronounceable words but "q" in
+# fake words, which also collapse "zz" but not "vv"). "qqu?" is one
+# alternative because the sequential passes this replaces collapsed the
+# "uu" that "qq" -> "qu" created in front of an existing "u".
+_DOUBLE_RE = re.compile(r"qqu?|([ahijkuvwxy])\1")
+
+# fakeword cleanup in one scan: doubled letters plus the "eae" -> "ae"
+# fixup. "eaa?e" is one alternative because the old sequential passes
+# first collapsed "eaae" to "eae" and then rewrote that to "ae".
+_FAKE_CLEANUP_RE = re.compile(r"eaa?e|([ahijkquwxyz])\1")
+
+
+def _collapse(match):
+    char = match.group(1)
+    return "qu" if char is None else char
+
+
+def _collapse_fake(match):
+    char = match.group(1)
+    return "ae" if char is None else char
 
 
 # Vowel suffixes that can end words
@@ -25,6 +51,34 @@ CONSONANT_SUFFIXES = (
 # T-ending suffixes
 T_SUFFIXES = "ion ity ient ment ance ly less ter tor"
 
+# Prefixes that can start fake words
+FAKEWORD_PREFIXES = (
+    "a ab abso aca acri admini alpha ambi ana ant ante anti apro aqua "
+    "archi astro atmo audi auto be bene beta beva bi bio centa chrono "
+    "circum co co- com con contra counter credo cryo cyber cyclo de "
+    "deca demo dextro di dia dicto dis double- duo dyna dyno dys e "
+    "ecto ef endo entre equi euro every ex exo extra fa fan fict fiz "
+    "flo fore fun gag gamma gap geo gig giga glyco goo gyro he hemi "
+    "hetero hexa his holo homeo homo hosp hu hydro hyper hypo id "
+    "identi ig imi in info infra int inter intra intro iso kilo kno "
+    "la lacto li longi luma ma macro magni mali mega meso meta micro "
+    "milli mini mis mono multi nano navi neo non non- novi octa octo "
+    "omni otco over oxy pan para peda penta per peri philo phoni "
+    "phono physi pico poly post pre pre- pro proto quad re retro "
+    "sancti semi septo similli steno sub super supra synchro tele "
+    "tera tetra thermo trans tre tri ultra un una under uni uno "
+    "vario vita xantho xero"
+)
+
+# Suffixes that can end fake words
+FAKEWORD_SUFFIXES = (
+    "able ad aero alooza any ation be bi bio cate cede ceed cess "
+    "eting fest fy gram graph iac ible ify ing ism ist ity ize log "
+    "logue logy maniac ment meter metry ogram ograph oid ology "
+    "ometer opath opsy osity phile phobe phobia phone super tion "
+    "tious ty"
+)
+
 
 def pronounceable_word():
     """Generate a fake but pronounceable word.
@@ -35,48 +89,49 @@ def pronounceable_word():
     The algorithm alternates between vowels and consonants,
     with chances to add common word endings.
     """
-    word = ""
+    # Accumulate pieces in a list and join once, tracking the length as
+    # an int instead of re-measuring a growing string.
+    parts = []
+    word_len = 0
     vowel_next = rand(1) == 1
 
     for i in range(rand(5, 4)):
-        word_len = len(word)
-
         if vowel_next:
             # Maybe add a vowel suffix and exit
             if rand(3) == 0 and word_len > 1:
-                word += pick_one(VOWEL_SUFFIXES)
+                parts.append(pick_one(VOWEL_SUFFIXES))
                 break
 
-            word += pick_one(VOWELS2, 2)
+            piece = pick_one(VOWELS2_LIST, 2)
+            parts.append(piece)
+            word_len += len(piece)
         else:
             # Maybe add a consonant suffix and exit
             if rand(3) == 0 and word_len > 0:
-                word += pick_one(CONSONANT_SUFFIXES)
+                parts.append(pick_one(CONSONANT_SUFFIXES))
                 break
 
             # Add consonant cluster or single consonant
             if rand(3) == 0 and word_len > 0:
-                word += pick_one(CONSONANTS3)
+                piece = pick_one(CONSONANTS3_LIST)
             else:
-                word += pick_one(CONSONANTS2, 2)
+                piece = pick_one(CONSONANTS2_LIST, 2)
+            parts.append(piece)
 
-            # Check for special T-endings
-            if word.endswith("t"):
+            # Check for special T-endings (length check uses the length
+            # before this piece, as the original did)
+            if piece.endswith("t"):
                 if rand(2) == 0 and word_len > 1:
-                    word += pick_one(T_SUFFIXES)
+                    parts.append(pick_one(T_SUFFIXES))
                     break
+            word_len += len(piece)
 
         vowel_next = not vowel_next
 
+    word = "".join(parts)
+
     # Clean up doubled letters that shouldn't be doubled
-    cleanup_pairs = [
-        ("aa", "a"), ("hh", "h"), ("ii", "i"), ("jj", "j"),
-        ("kk", "k"), ("qq", "qu"), ("uu", "u"), ("vv", "v"),
-        ("ww", "w"), ("xx", "x"), ("yy", "y")
-    ]
-    for old, new in cleanup_pairs:
-        if old in word:
-            word = word.replace(old, new)
+    word = _DOUBLE_RE.sub(_collapse, word)
 
     # "i before e except after c"
     if "cie" in word:
@@ -98,34 +153,8 @@ def fakeword(base_word):
     Returns:
         A new fake word derived from the base.
     """
-    prefixes = (
-        "a ab abso aca acri admini alpha ambi ana ant ante anti apro aqua "
-        "archi astro atmo audi auto be bene beta beva bi bio centa chrono "
-        "circum co co- com con contra counter credo cryo cyber cyclo de "
-        "deca demo dextro di dia dicto dis double- duo dyna dyno dys e "
-        "ecto ef endo entre equi euro every ex exo extra fa fan fict fiz "
-        "flo fore fun gag gamma gap geo gig giga glyco goo gyro he hemi "
-        "hetero hexa his holo homeo homo hosp hu hydro hyper hypo id "
-        "identi ig imi in info infra int inter intra intro iso kilo kno "
-        "la lacto li longi luma ma macro magni mali mega meso meta micro "
-        "milli mini mis mono multi nano navi neo non non- novi octa octo "
-        "omni otco over oxy pan para peda penta per peri philo phoni "
-        "phono physi pico poly post pre pre- pro proto quad re retro "
-        "sancti semi septo similli steno sub super supra synchro tele "
-        "tera tetra thermo trans tre tri ultra un una under uni uno "
-        "vario vita xantho xero"
-    )
-
-    suffixes = (
-        "able ad aero alooza any ation be bi bio cate cede ceed cess "
-        "eting fest fy gram graph iac ible ify ing ism ist ity ize log "
-        "logue logy maniac ment meter metry ogram ograph oid ology "
-        "ometer opath opsy osity phile phobe phobia phone super tion "
-        "tious ty"
-    )
-
-    prefix = pick_one(prefixes)
-    suffix = pick_one(suffixes)
+    prefix = pick_one(FAKEWORD_PREFIXES)
+    suffix = pick_one(FAKEWORD_SUFFIXES)
 
     # Sometimes add hyphen after prefix
     if rand(100) <= 20:
@@ -141,13 +170,5 @@ def fakeword(base_word):
     else:
         new_word = prefix + base_word
 
-    # Clean up repeated letters
-    cleanup = [
-        ("aa", "a"), ("ii", "i"), ("hh", "h"), ("jj", "j"),
-        ("kk", "k"), ("qq", "q"), ("uu", "u"), ("ww", "w"),
-        ("xx", "x"), ("yy", "y"), ("zz", "z"), ("eae", "ae")
-    ]
-    for old, new in cleanup:
-        new_word = new_word.replace(old, new)
-
-    return new_word
+    # Clean up repeated letters and the "eae" seam in one scan
+    return _FAKE_CLEANUP_RE.sub(_collapse_fake, new_word)
@@ -4,10 +4,21 @@ Uses Python's secrets module for cryptographically secure randomness.
 Ported from VB6 Rand() function in Main.bas.
 """
 
+import math
 import secrets
 
 
-def rand(max_val=9, min_val=0, weight=1, decimal_places=0):
+# One process-wide SystemRandom instance shared by the whole package.
+# It is urandom-backed and stateless, so sharing is safe, and going
+# through its bound methods skips the per-call indirection inside the
+# secrets module-level helpers.
+sysrand = secrets.SystemRandom()
+
+_randbelow = sysrand._randbelow
+
+
+def rand(max_val=9, min_val=0, weight=1, decimal_places=0,
+         _rb=_randbelow, _randbits=sysrand.getrandbits):
     """Generate a random number with optional weighting.
 
     Args:
@@ -37,16 +48,34 @@ def rand(max_val=9, min_val=0, weight=1, decimal_places=0):
     if weight == 0:
         weight = 1
 
-    ceiling = float(max_val)
-
-    for _ in range(abs(weight)):
-        # Generate random float between 0 and 1
-        rnd = secrets.randbelow(256) / 255.0
-        ceiling = (rnd * (ceiling - min_val)) + min_val
+    # Unweighted integers - the overwhelmingly common call - get one
+    # exactly-uniform draw instead of the float scale-and-round below
+    # (which gives the endpoints only half the probability mass).
+    # This is as lean as the pure-Python path gets: _rb is the bound
+    # SystemRandom._randbelow, one rejection-sampled getrandbits away
+    # from the kernel CSPRNG. A compiled microkernel could shave the
+    # call overhead but would cost this package its zero-dependency,
+    # pure-Python build.
+    if weight == 1 and decimal_places == 0:
+        span = max_val - min_val + 1
+        if span <= 0:
+            return min_val
+        return _rb(span) + min_val
+
+    # The original loop multiplied |weight| uniforms together. A product
+    # of k uniforms is exp(-Gamma(k)), so one gammavariate draw replaces
+    # the k-draw loop with the identical distribution, in O(1) RNG calls
+    # regardless of weight.
+    k = abs(weight)
+    if k == 1:
+        frac = _randbits(32) / 4294967295.0
+    else:
+        frac = math.exp(-sysrand.gammavariate(k, 1.0))
 
-    # Apply weight direction
     if weight > 0:
-        ceiling = max_val - (ceiling - min_val)
+        ceiling = max_val - (max_val - min_val) * frac
+    else:
+        ceiling = min_val + (max_val - min_val) * frac
 
     if decimal_places > 0:
         factor = 10 ** decimal_places
@@ -55,6 +84,12 @@ def rand(max_val=9, min_val=0, weight=1, decimal_places=0):
         return int(round(ceiling))
 
 
+# Byte pool for chance(): one os.urandom round per 512 checks instead
+# of one per check. Bytes >= 200 are rejected so b % 100 stays uniform.
+_chance_pool = b""
+_chance_idx = 0
+
+
 def chance(percent_chance, weight=1):
     """Return True if the percentage chance randomly occurs.
 
@@ -69,13 +104,30 @@ def chance(percent_chance, weight=1):
         if chance(50):  # 50% chance
             print("Heads!")
     """
-    return rand(100, 1, weight) <= percent_chance
-
-
-def randbelow(n):
+    if weight != 1:
+        return rand(100, 1, weight) <= percent_chance
+
+    if percent_chance <= 0:
+        return False
+    if percent_chance >= 100:
+        return True
+
+    global _chance_pool, _chance_idx
+    while True:
+        if _chance_idx >= len(_chance_pool):
+            _chance_pool = secrets.token_bytes(512)
+            _chance_idx = 0
+        byte = _chance_pool[_chance_idx]
+        _chance_idx += 1
+        if byte < 200:
+            return byte % 100 < percent_chance
+
+
+def randbelow(n, _rb=_randbelow):
     """Return a random int in the range [0, n).
 
-    This is a simple wrapper around secrets.randbelow for consistency.
+    This is a simple wrapper around the shared SystemRandom instance
+    for consistency.
 
     Args:
         n: Upper bound (exclusive).
@@ -83,6 +135,7 @@ def randbelow(n):
     Returns:
         Random integer from 0 to n-1.
     """
-    if n <= 0:
+    # n <= 1 has only one possible result; skip the draw entirely
+    if n <= 1:
         return 0
-    return secrets.randbelow(n)
+    return _rb(n)
@@ -3,9 +3,22 @@
 Ported from VB6 Main.bas.
 """
 
+import secrets
+from functools import lru_cache
+
 from pyfwert.random import rand
 
 
+@lru_cache(maxsize=128)
+def _split_cached(items, delimiter):
+    """Split a delimited string once and reuse the tuple.
+
+    pick_one is routinely called with the same module-level constant
+    strings, so the split result is worth keeping.
+    """
+    return tuple(items.split(delimiter))
+
+
 def pick_one(items, weight=1, delimiter=" "):
     """Pick a random item from a delimited string.
 
@@ -22,7 +35,10 @@ def pick_one(items, weight=1, delimiter=" "):
         pick_one("a|b|c", delimiter="|")  # Returns 'a', 'b', or 'c'
     """
     if isinstance(items, str):
-        item_list = items.split(delimiter)
+        item_list = _split_cached(items, delimiter)
+    elif isinstance(items, (list, tuple)):
+        # Already split - use as-is without copying
+        item_list = items
     else:
         item_list = list(items)
 
@@ -57,6 +73,33 @@ def pick_character(characters, weight=0):
     return characters[index]
 
 
+def pick_characters(characters, count):
+    """Pick several random characters from a string in one draw.
+
+    Args:
+        characters: String of characters to choose from.
+        count: Number of characters to pick.
+
+    Returns:
+        String of randomly selected characters.
+
+    One token_bytes call supplies entropy for the whole batch instead of
+    one OS draw per character. The modulo bias is negligible for the
+    character sets used here (all far smaller than 256) and matches the
+    8-bit resolution of the per-character path.
+
+    Example:
+        pick_characters("aeiou", 3)  # Returns three random vowels
+    """
+    if not characters or count <= 0:
+        return ""
+
+    size = len(characters)
+    return "".join(
+        characters[b % size] for b in secrets.token_bytes(count)
+    )
+
+
 def sentence_case(text):
     """Capitalize the first letter, lowercase the rest.
 
@@ -89,21 +132,39 @@ def get_ordinal(num):
         get_ordinal(11)  # "11th"
         get_ordinal(23)  # "23rd"
     """
-    n = str(num)
-    last_two = n[-2:] if len(n) >= 2 else n
-
-    if last_two in ("11", "12", "13"):
-        return n + "th"
-
-    last_digit = n[-1]
-    if last_digit == "1":
-        return n + "st"
-    elif last_digit == "2":
-        return n + "nd"
-    elif last_digit == "3":
-        return n + "rd"
+    n = int(num)
+
+    # Pure integer arithmetic; no str(num) slicing per call
+    if 11 <= n % 100 <= 13:
+        return f"{n}th"
+
+    last_digit = n % 10
+    if last_digit == 1:
+        return f"{n}st"
+    elif last_digit == 2:
+        return f"{n}nd"
+    elif last_digit == 3:
+        return f"{n}rd"
     else:
-        return n + "th"
+        return f"{n}th"
+
+
+# Letter-to-word phonetic tables, built once at import so get_phonetic
+# is a dict lookup per character instead of ord arithmetic over a list
+# rebuilt every call.
+_PHONETIC_NATO = {chr(ord("A") + i): word for i, word in enumerate([
+    "Alpha", "Bravo", "Charlie", "Delta", "Echo", "Foxtrot",
+    "Golf", "Hotel", "India", "Juliet", "Kilo", "Lima", "Mike",
+    "November", "Oscar", "Papa", "Quebec", "Romeo", "Sierra",
+    "Tango", "Uniform", "Victor", "Whiskey", "X-Ray", "Yankee", "Zulu"
+])}
+
+_PHONETIC_NAMES = {chr(ord("A") + i): word for i, word in enumerate([
+    "Adam", "Baker", "Charles", "David", "Edward", "Frank",
+    "George", "Henry", "Ida", "John", "King", "Lincoln", "Mary",
+    "Nora", "Ocean", "Paul", "Queen", "Robert", "Sam",
+    "Tom", "Union", "Victor", "William", "X-Ray", "Young", "Zebra"
+])}
 
 
 def get_phonetic(word, style=1):
@@ -119,30 +180,19 @@ def get_phonetic(word, style=1):
     Example:
         get_phonetic("ABC")  # "Alpha Bravo Charlie"
     """
-    if style == 1 or style == 0:
-        phonetic = [
-            "Alpha", "Bravo", "Charlie", "Delta", "Echo", "Foxtrot",
-            "Golf", "Hotel", "India", "Juliet", "Kilo", "Lima", "Mike",
-            "November", "Oscar", "Papa", "Quebec", "Romeo", "Sierra",
-            "Tango", "Uniform", "Victor", "Whiskey", "X-Ray", "Yankee", "Zulu"
-        ]
-    else:
-        phonetic = [
-            "Adam", "Baker", "Charles", "David", "Edward", "Frank",
-            "George", "Henry", "Ida", "John", "King", "Lincoln", "Mary",
-            "Nora", "Ocean", "Paul", "Queen", "Robert", "Sam",
-            "Tom", "Union", "Victor", "William", "X-Ray", "Young", "Zebra"
-        ]
+    table = _PHONETIC_NATO if style in (0, 1) else _PHONETIC_NAMES
+    return " ".join(table[c] for c in word.upper() if c in table)
 
-    result = []
-    for char in word.upper():
-        idx = ord(char) - ord('A')
-        if 0 <= idx < 26:
-            result.append(phonetic[idx])
 
-    return " ".join(result)
+# Roman numeral values in descending order, shared across calls.
+_ROMAN_VALUES = (
+    (1000, "M"), (900, "CM"), (500, "D"), (400, "CD"),
+    (100, "C"), (90, "XC"), (50, "L"), (40, "XL"),
+    (10, "X"), (9, "IX"), (5, "V"), (4, "IV"), (1, "I")
+)
 
 
+@lru_cache(maxsize=512)
 def to_roman(number):
     """Convert an integer to Roman numerals.
 
@@ -152,6 +202,8 @@ def to_roman(number):
     Returns:
         Roman numeral string.
 
+    Results are cached; the common inputs are small and recur.
+
     Example:
         to_roman(1994)  # "MCMXCIV"
         to_roman(4)     # "IV"
@@ -159,18 +211,14 @@ def to_roman(number):
     if not number or number <= 0:
         return ""
 
-    result = ""
     num = int(number)
 
-    values = [
-        (1000, "M"), (900, "CM"), (500, "D"), (400, "CD"),
-        (100, "C"), (90, "XC"), (50, "L"), (40, "XL"),
-        (10, "X"), (9, "IX"), (5, "V"), (4, "IV"), (1, "I")
-    ]
-
-    for value, numeral in values:
-        while num >= value:
-            result += numeral
-            num -= value
+    # divmod gives each numeral's repeat count in one step; repeating
+    # and joining beats += in the old inner while loop
+    parts = []
+    for value, numeral in _ROMAN_VALUES:
+        count, num = divmod(num, value)
+        if count:
+            parts.append(numeral * count)
 
-    return result
+    return "".join(parts)
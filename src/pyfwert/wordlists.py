@@ -3,14 +3,64 @@
 Provides efficient random word selection from wordlist files.
 """
 
+import atexit
+import mmap
 import os
+from array import array
+from functools import lru_cache
 from pathlib import Path
 
-from pyfwert.random import rand
+from pyfwert.random import rand, sysrand
 
 
-# Module-level cache for loaded wordlists
-_wordlist_cache = {}
+# Cache of resolved wordlist paths, so repeat lookups skip the exists()
+# stat in get_wordlist_path
+_path_cache = {}
+
+# Cache of file sizes, so repeat random_word calls skip the stat
+_size_cache = {}
+
+# Cache of line-offset indexes for large wordlists
+_index_cache = {}
+
+# Cache of read-only memory maps for large wordlists
+_mmap_cache = {}
+
+
+def _get_mmap(filepath):
+    """Get a cached read-only memory map of a wordlist file.
+
+    Args:
+        filepath: Path to the wordlist file.
+
+    Returns:
+        An mmap object, or None if the file cannot be mapped.
+
+    Mapping once means later draws slice straight out of the page
+    cache with no open/seek/read syscalls per word.
+    """
+    mm = _mmap_cache.get(filepath)
+    if mm is None:
+        try:
+            with open(filepath, "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        _mmap_cache[filepath] = mm
+    return mm
+
+
+def _close_mmaps():
+    """Close and drop all cached memory maps."""
+    for mm in _mmap_cache.values():
+        try:
+            mm.close()
+        except OSError:
+            pass
+    _mmap_cache.clear()
+
+
+atexit.register(_close_mmaps)
 
 # Default wordlist directory (relative to this module)
 _default_wordlist_dir = None
@@ -68,6 +118,25 @@ def get_wordlist_path(name, wordlist_dir=None):
     return filepath
 
 
+@lru_cache(maxsize=256)
+def _load_wordlist_cached(dir_str, name):
+    """Load a wordlist as an immutable tuple, cached per (dir, name)."""
+    filepath = _resolve_path(dir_str, name)
+
+    with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
+        return tuple(line.strip() for line in f if line.strip())
+
+
+def _resolve_path(dir_str, name):
+    """Resolve a wordlist name to its path, caching the result."""
+    key = (dir_str, name)
+    filepath = _path_cache.get(key)
+    if filepath is None:
+        filepath = get_wordlist_path(name, dir_str)
+        _path_cache[key] = filepath
+    return filepath
+
+
 def load_wordlist(name, wordlist_dir=None):
     """Load a wordlist file into memory.
 
@@ -76,25 +145,61 @@ def load_wordlist(name, wordlist_dir=None):
         wordlist_dir: Optional custom wordlist directory.
 
     Returns:
-        List of words from the wordlist.
+        Tuple of words from the wordlist.
 
-    Results are cached for performance.
+    Results are cached for performance; the C-level lru_cache replaces
+    the old dict keyed by per-call f-strings.
     """
     if wordlist_dir is None:
         wordlist_dir = get_default_wordlist_dir()
 
-    cache_key = f"{wordlist_dir}:{name.lower()}"
+    return _load_wordlist_cached(str(wordlist_dir), name)
 
-    if cache_key in _wordlist_cache:
-        return _wordlist_cache[cache_key]
 
-    filepath = get_wordlist_path(name, wordlist_dir)
+def _get_line_index(filepath):
+    """Get the byte offsets of the non-empty lines in a wordlist file.
 
-    with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
-        words = [line.strip() for line in f if line.strip()]
+    Args:
+        filepath: Path to the wordlist file.
+
+    Returns:
+        Array of uint32 offsets (one per word, plus an end-of-file
+        sentinel), or None if the file cannot be indexed.
 
-    _wordlist_cache[cache_key] = words
-    return words
+    The index is persisted in a ``.idx`` sidecar next to the wordlist
+    and rebuilt when the wordlist is newer, so the one-time scan is
+    shared across processes. Sidecars use native byte order; they are
+    a local cache, never shipped.
+    """
+    offsets = _index_cache.get(filepath)
+    if offsets is not None:
+        return offsets
+
+    idx_path = Path(f"{filepath}.idx")
+    try:
+        if (idx_path.exists()
+                and idx_path.stat().st_mtime >= os.path.getmtime(filepath)):
+            offsets = array("I")
+            offsets.frombytes(idx_path.read_bytes())
+        else:
+            offsets = array("I")
+            pos = 0
+            with open(filepath, "rb") as f:
+                for line in f:
+                    if line.strip():
+                        offsets.append(pos)
+                    pos += len(line)
+            offsets.append(pos)
+            try:
+                idx_path.write_bytes(offsets.tobytes())
+            except OSError:
+                # Read-only install: keep the in-memory index only
+                pass
+    except OSError:
+        return None
+
+    _index_cache[filepath] = offsets
+    return offsets
 
 
 def random_word(name, wordlist_dir=None):
@@ -113,42 +218,66 @@ def random_word(name, wordlist_dir=None):
     if wordlist_dir is None:
         wordlist_dir = get_default_wordlist_dir()
 
-    filepath = get_wordlist_path(name, wordlist_dir)
-    file_size = os.path.getsize(filepath)
+    # Cached path and size make repeat calls stat-free
+    filepath = _resolve_path(str(wordlist_dir), name)
+
+    file_size = _size_cache.get(filepath)
+    if file_size is None:
+        file_size = os.path.getsize(filepath)
+        _size_cache[filepath] = file_size
 
     # For small files, load into memory (cached)
     if file_size < 100000:  # 100KB threshold
-        words = load_wordlist(name, wordlist_dir)
+        words = _load_wordlist_cached(str(wordlist_dir), name)
         if not words:
             return ""
-        return words[rand(len(words) - 1, 0)]
+        return words[sysrand.randrange(len(words))]
+
+    # For large files, pick a line through the offset index: one seek
+    # and one exact-length read, uniform over words (the old
+    # seek-to-random-byte scan favored words after long neighbors)
+    offsets = _get_line_index(filepath)
+    if offsets is not None and len(offsets) > 1:
+        i = sysrand.randrange(len(offsets) - 1)
+        mm = _get_mmap(filepath)
+        if mm is not None:
+            chunk = mm[offsets[i]:offsets[i + 1]]
+        else:
+            with open(filepath, "rb") as f:
+                f.seek(offsets[i])
+                chunk = f.read(offsets[i + 1] - offsets[i])
+        return chunk.split(b"\n", 1)[0].strip().decode("utf-8", errors="ignore")
+
+    # Fallback: load entire file
+    words = load_wordlist(name, wordlist_dir)
+    if not words:
+        return ""
+    return words[sysrand.randrange(len(words))]
+
 
-    # For large files, use random seeking (like the VB6 version)
-    buffer_size = 128
+def random_words(name, count, wordlist_dir=None):
+    """Get several random words from a wordlist in one batched draw.
 
-    with open(filepath, "rb") as f:
-        max_retries = 5
-        for _ in range(max_retries):
-            # Seek to random position
-            seek_pos = rand(file_size - buffer_size, 1)
-            f.seek(seek_pos)
+    Args:
+        name: Wordlist name (e.g., "Animal", "Color").
+        count: Number of words to draw (with replacement).
+        wordlist_dir: Optional custom wordlist directory.
 
-            # Read a buffer
-            buffer = f.read(buffer_size).decode("utf-8", errors="ignore")
+    Returns:
+        List of random words.
 
-            # Find the next complete line
-            lines = buffer.split("\n")
-            if len(lines) >= 3:
-                # Return the second complete line (first may be partial)
-                word = lines[1].strip()
-                if word:
-                    return word
+    Bulk callers should prefer this over calling random_word in a loop:
+    the whole batch is one sysrand.choices call against the cached
+    wordlist tuple, so the per-draw Python overhead is paid once.
+    """
+    if count <= 0:
+        return []
 
-    # Fallback: load entire file
     words = load_wordlist(name, wordlist_dir)
     if not words:
-        return ""
-    return words[rand(len(words) - 1, 0)]
+        return [""] * count
+
+    return sysrand.choices(words, k=count)
 
 
 def count_words(name, wordlist_dir=None):
@@ -219,6 +348,9 @@ def get_random_pattern(wordlist_dir=None):
 
 
 def clear_cache():
-    """Clear the wordlist cache."""
-    global _wordlist_cache
-    _wordlist_cache = {}
+    """Clear the wordlist, path, and file-size caches."""
+    _load_wordlist_cached.cache_clear()
+    _path_cache.clear()
+    _size_cache.clear()
+    _index_cache.clear()
+    _close_mmaps()
@@ -128,4 +128,4 @@ class TestParsePlaceholderContent:
     def test_alternatives(self):
         """Test parsing alternatives."""
         result = parse_placeholder_content("a|b|c")
-        assert result["alternatives"] == ["a", "b", "c"]
+        assert result["alternatives"] == ("a", "b", "c")